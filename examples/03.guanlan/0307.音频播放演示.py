@@ -55,15 +55,16 @@ def demo_basic_playback():
 
         print("✓ 音频播放器已就绪\n")
 
-        # 播放预定义音效
+        # 播放预定义音效（序列由后台线程播放，间隔 0.5 秒）
         print(">>> 播放预定义音效")
         sounds = ["buy", "sell", "con_buy", "con_sell", "cancel", "error", "alarm"]
 
-        for sound in sounds:
-            print(f"  播放: {sound}.wav")
-            player.play(sound, async_play=False)  # 同步播放，方便演示
-            time.sleep(0.5)  # 间隔 0.5 秒
+        print(f"  提交序列: {' → '.join(f'{sound}.wav' for sound in sounds)}")
+        player.play_sequence([(sound, 500) for sound in sounds])
 
+        # play_sequence 立即返回，主线程在此等待序列播完，避免与下一项演示的声音重叠
+        time.sleep(0.5 * len(sounds))
+        print("  序列播放完毕")
         print()
 
     except Exception as e:
@@ -90,11 +91,12 @@ def demo_volume_control():
 
         volumes = [1.0, 0.7, 0.5, 0.3, 0.1]
 
+        # 音量只改写通道增益，不重新加载或缩放音频数据
         for vol in volumes:
             player.set_volume(vol)
             current_vol = player.get_volume()
             print(f"  音量: {current_vol:.0%}")
-            player.play("buy", async_play=False)
+            player.play("buy")
             time.sleep(0.5)
 
         # 恢复默认音量
@@ -126,7 +128,7 @@ def demo_async_playback():
 
         # 异步播放
         print("  开始异步播放...")
-        player.play("buy", async_play=True)
+        player.play("buy")
         print("  函数立即返回，音频在后台播放")
 
         # 等待播放完成
@@ -158,7 +160,7 @@ def demo_playback_control():
 
         # 开始播放
         print("  开始播放 alarm.wav（较长音频）")
-        player.play("alarm", async_play=True)
+        player.play("alarm")
 
         time.sleep(1)
 
@@ -196,14 +198,17 @@ def demo_convenience_functions():
         print(">>> 使用便捷函数播放音效\n")
 
         print("  使用 play() 函数:")
-        play("buy", async_play=False)
-        print("    play('buy') - 完成")
+        play("buy")
+        print("    play('buy') - 已提交")
 
         time.sleep(0.5)
 
         print("\n  使用 play_file() 函数:")
-        play_file("sell.wav", async_play=False)
-        print("    play_file('sell.wav') - 完成")
+        play_file("sell.wav")
+        print("    play_file('sell.wav') - 已提交")
+
+        # 播放在后台通道进行，稍作等待再进入下一项演示
+        time.sleep(0.5)
 
         print()
 
@@ -223,29 +228,20 @@ def demo_practical_scenario():
 
         print(">>> 场景：模拟交易流程\n")
 
-        # 下单
-        print("  1. 下买单...")
-        play("buy", async_play=False)
-        time.sleep(0.5)
-
-        print("  2. 买单成交...")
-        play("con_buy", async_play=False)
-        time.sleep(0.5)
-
-        print("  3. 下卖单...")
-        play("sell", async_play=False)
-        time.sleep(0.5)
-
-        print("  4. 卖单成交...")
-        play("con_sell", async_play=False)
-        time.sleep(0.5)
-
-        print("  5. 下单被拒...")
-        play("error", async_play=False)
-        time.sleep(0.5)
-
-        print("  6. 撤单成功...")
-        play("cancel", async_play=False)
+        steps = [
+            ("下买单", "buy"),
+            ("买单成交", "con_buy"),
+            ("下卖单", "sell"),
+            ("卖单成交", "con_sell"),
+            ("下单被拒", "error"),
+            ("撤单成功", "cancel"),
+        ]
+
+        # 每个交易事件发生时各自播放音效（play 立即返回，间隔模拟事件先后到达）
+        for i, (desc, sound) in enumerate(steps, 1):
+            print(f"  {i}. {desc}...")
+            play(sound)
+            time.sleep(0.5)
 
         print()
 
@@ -13,28 +13,41 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import asyncio
+import functools
+import hashlib
+import importlib.util
+import time
 from datetime import datetime, timedelta
 
-# 尝试导入 rich 库用于美化输出
-try:
-    from rich.console import Console
-    from rich.markdown import Markdown
-    from rich.live import Live
-    RICH_AVAILABLE = True
-    console = Console()
-except ImportError:
-    RICH_AVAILABLE = False
-    console = None
+# rich 库用于美化输出（启动时只检测是否安装，用到时再导入）
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
 
 
 # 配置文件路径（相对于 examples 目录）
 CONFIG_PATH = Path(__file__).parent.parent / "config" / "ai.json"
 
+# 流式渲染最小刷新间隔（秒），合并期间到达的分块
+RENDER_INTERVAL = 0.1
+
+# 缓存回放时每个分块的字符数
+REPLAY_CHUNK_SIZE = 8
+
+# AI 回复缓存文件（相对于 .guanlan 目录）
+RESPONSE_CACHE_FILE = "cache/ai_response.json"
+
+
+@functools.cache
+def get_console():
+    """获取 rich 控制台（首次调用时创建）"""
+    from rich.console import Console
+    return Console()
+
 
 def print_markdown(text: str) -> None:
     """打印 Markdown 格式文本"""
     if RICH_AVAILABLE:
-        console.print(Markdown(text))
+        from rich.markdown import Markdown
+        get_console().print(Markdown(text))
     else:
         print(text)
 
@@ -83,16 +96,93 @@ def demo_config():
     return len(missing) < len(config.list_models())
 
 
+class MarkdownSegments:
+    """分段缓存的流式 Markdown 渲染
+
+    流式响应的前缀不再变化，按空行切分段落后，
+    已完成的段落只解析一次并缓存，每次刷新只重新解析最后一段。
+    代码块内的空行不作为分段边界。
+    """
+
+    def __init__(self) -> None:
+        self._done: list = []
+        self._consumed: int = 0
+
+    def render(self, text: str):
+        from rich.console import Group
+        from rich.markdown import Markdown
+
+        tail = text[self._consumed:]
+        start = 0
+        while (end := tail.find("\n\n", start)) >= 0:
+            block = tail[:end]
+            # 代码块未闭合，继续向后寻找边界
+            if block.count("```") % 2:
+                start = end + 2
+                continue
+            if block.strip():
+                self._done.append(Markdown(block))
+            self._consumed += end + 2
+            tail = tail[end + 2:]
+            start = 0
+        return Group(*self._done, Markdown(tail))
+
+
+def make_cache_key(message: str, system_prompt: str = "", model: str = "") -> str:
+    """按模型、系统提示词和消息内容生成缓存键（SHA-256 摘要）"""
+    raw = "\0".join((model, system_prompt, message))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_cached(key: str) -> str | None:
+    """获取缓存的回复，未命中返回 None"""
+    from guanlan.core.utils.common import load_json_file
+    return load_json_file(RESPONSE_CACHE_FILE).get(key)
+
+
+def set_cached(key: str, response: str) -> None:
+    """写入缓存（原子替换缓存文件，中途失败不会损坏已有缓存）"""
+    from guanlan.core.utils.common import load_json_file, save_json_file
+    cache = load_json_file(RESPONSE_CACHE_FILE)
+    cache[key] = response
+    save_json_file(RESPONSE_CACHE_FILE, cache)
+
+
+class ReplayStream:
+    """以流式分块回放缓存的回复（接口与 AIClient.chat_stream 一致）"""
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+
+    async def chat_stream(self, message: str, **kwargs):
+        for i in range(0, len(self._text), REPLAY_CHUNK_SIZE):
+            yield self._text[i:i + REPLAY_CHUNK_SIZE]
+            await asyncio.sleep(0)
+
+
 async def stream_chat_with_markdown(ai, message: str, **kwargs) -> str:
-    """流式对话并实时渲染 Markdown"""
+    """流式对话并实时渲染 Markdown
+
+    分块到达时只累积文本，按 RENDER_INTERVAL 节流刷新，
+    且只重新解析仍在增长的最后一段。
+    """
     full_response = ""
 
     if RICH_AVAILABLE:
+        from rich.live import Live
+        from rich.markdown import Markdown
+
         # 使用 rich Live 实时渲染 Markdown
-        with Live(Markdown(""), console=console, refresh_per_second=10) as live:
+        segments = MarkdownSegments()
+        with Live(Markdown(""), console=get_console(), refresh_per_second=10) as live:
+            last_update = time.monotonic()
             async for chunk in ai.chat_stream(message, **kwargs):
                 full_response += chunk
-                live.update(Markdown(full_response))
+                now = time.monotonic()
+                if now - last_update >= RENDER_INTERVAL:
+                    live.update(segments.render(full_response))
+                    last_update = now
+            live.update(segments.render(full_response))
     else:
         # 普通流式输出
         async for chunk in ai.chat_stream(message, **kwargs):
@@ -174,8 +264,8 @@ async def demo_kline_analysis():
 
     ai = get_ai_client(CONFIG_PATH)
 
-    # 模拟 K 线数据
-    base_time = datetime.now() - timedelta(hours=10)
+    # 模拟 K 线数据（时间取整到小时，同一小时内重复运行可命中缓存）
+    base_time = datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=10)
     kline_data = []
 
     prices = [3850, 3865, 3870, 3855, 3880, 3895, 3890, 3905, 3920, 3915]
@@ -204,12 +294,19 @@ async def demo_kline_analysis():
             interval="1小时",
             strategy="趋势跟踪",
         )
-        print("\n[分析结果]")
-        await stream_chat_with_markdown(
-            ai,
+
+        # 相同 K 线数据直接回放缓存结果
+        key = make_cache_key(prompt, KLINE_ANALYSIS_SYSTEM, ai.get_default_model())
+        cached = get_cached(key)
+
+        print("\n[分析结果]" + ("（缓存）" if cached else ""))
+        response = await stream_chat_with_markdown(
+            ReplayStream(cached) if cached else ai,
             prompt,
             system_prompt=KLINE_ANALYSIS_SYSTEM,
         )
+        if not cached and response:
+            set_cached(key, response)
     except Exception as e:
         print(f"[错误] {e}")
 
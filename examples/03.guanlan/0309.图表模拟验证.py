@@ -5,7 +5,7 @@
 启动完整应用框架，用模拟 Tick 替代实盘行情推送到 EventEngine，
 走完整数据链路验证 ChartWindow。
 
-模拟速度：每 50ms 推一个 Tick，时间步长 3 秒，
+模拟速度：每 500ms 成批推送 10 个 Tick（平均 50ms 一个），时间步长 3 秒，
 约 1 秒形成一根 1 分钟 K 线，快速积累数据验证指标。
 
 删除本文件即可还原，不影响任何生产代码。
@@ -20,10 +20,12 @@ Author: 海山观澜
 
 import os
 import sys
-import random
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+import numpy as np
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 os.chdir(PROJECT_ROOT)  # pywebview 的 base_uri() 依赖 CWD
@@ -48,54 +50,81 @@ class MockTickPusher:
     生成随机 Tick 通过 EventEngine 推送，
     ChartWindow 通过正常的事件链路接收。
 
-    时间步长 3 秒 + 推送间隔 50ms → 约 1 秒钟产生一根 1 分钟 K 线。
+    时间步长 3 秒 + 平均推送间隔 50ms → 约 1 秒钟产生一根 1 分钟 K 线。
+    随机数在启动时按列批量生成，定时回调内只做数组索引。
+    定时器按 interval_ms × batch 触发，每次生成 batch 个 Tick
+    并通过 put_many 一次性放入事件队列，减少回调和加锁次数。
     """
 
     def __init__(self, event_engine, symbol: str = "OI605",
                  exchange: Exchange = Exchange.CZCE,
                  interval_ms: int = 50,
-                 time_step_sec: int = 3) -> None:
+                 time_step_sec: int = 3,
+                 batch: int = 10,
+                 pool_size: int = 100_000) -> None:
         self._event_engine = event_engine
         self._symbol = symbol
         self._exchange = exchange
 
         self._price = 8200.0
         self._volume = 100000
-        self._time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
-        self._time_step = timedelta(seconds=time_step_sec)
+        start = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+        self._epoch_ns = int(start.timestamp()) * 1_000_000_000
+        self._step_ns = time_step_sec * 1_000_000_000
         self._count = 0
+        self._batch = batch
+
+        # 不变字段预先绑定，每个 Tick 只传入变化的行情字段
+        # （vnpy TickData 为普通 dataclass，子类加 slots 无法去掉基类 __dict__）
+        self._new_tick = partial(
+            TickData,
+            symbol=symbol,
+            exchange=exchange,
+            gateway_name="MOCK",
+            open_interest=50000.0,
+        )
+
+        # 预生成随机序列（用完后循环复用）
+        rng = np.random.default_rng()
+        self._pool_size = pool_size
+        self._deltas = rng.normal(0, 4, pool_size).round(1).tolist()
+        self._highs = np.abs(rng.normal(0, 2, pool_size)).round(1).tolist()
+        self._lows = np.abs(rng.normal(0, 2, pool_size)).round(1).tolist()
+        self._vol_incs = rng.integers(1, 21, pool_size).tolist()
 
         self._timer = QTimer()
-        self._timer.timeout.connect(self._push_tick)
-        self._timer.start(interval_ms)
+        self._timer.timeout.connect(self._on_timer)
+        self._timer.start(interval_ms * batch)
 
         print(f"[模拟行情] {symbol}.{exchange.value} | "
-              f"间隔={interval_ms}ms 时间步长={time_step_sec}s")
-
-    def _push_tick(self) -> None:
-        self._time += self._time_step
-        self._price = round(self._price + random.gauss(0, 4), 1)
-        self._volume += random.randint(1, 20)
+              f"间隔={interval_ms}ms×{batch} 时间步长={time_step_sec}s")
+
+    def _on_timer(self) -> None:
+        events = [Event(EVENT_TICK, self._make_tick()) for _ in range(self._batch)]
+        self._event_engine.put_many(events)
+
+    def _make_tick(self) -> TickData:
+        i = self._count % self._pool_size
+        self._epoch_ns += self._step_ns
+        dt = datetime.fromtimestamp(self._epoch_ns / 1e9)
+        self._price = round(self._price + self._deltas[i], 1)
+        self._volume += self._vol_incs[i]
         self._count += 1
 
-        tick = TickData(
-            symbol=self._symbol,
-            exchange=self._exchange,
-            datetime=self._time,
-            gateway_name="MOCK",
+        tick = self._new_tick(
+            datetime=dt,
             last_price=self._price,
-            high_price=round(self._price + abs(random.gauss(0, 2)), 1),
-            low_price=round(self._price - abs(random.gauss(0, 2)), 1),
+            high_price=round(self._price + self._highs[i], 1),
+            low_price=round(self._price - self._lows[i], 1),
             volume=self._volume,
             turnover=self._volume * self._price,
-            open_interest=50000.0,
         )
 
-        self._event_engine.put(Event(EVENT_TICK, tick))
-
         if self._count % 100 == 0:
             print(f"[模拟行情] Tick #{self._count} | "
-                  f"时间={self._time.strftime('%H:%M:%S')} 价格={self._price}")
+                  f"时间={dt:%H:%M:%S} 价格={self._price}")
+
+        return tick
 
     def stop(self) -> None:
         self._timer.stop()
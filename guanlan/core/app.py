@@ -10,6 +10,8 @@ Author: 海山观澜
 
 from __future__ import annotations
 
+from typing import Any
+
 from vnpy.trader.event import EVENT_CONTRACT
 from vnpy.trader.object import ContractData, SubscribeRequest
 from guanlan.core.trader.gateway import CtpGateway, EVENT_CONTRACT_INITED
@@ -18,6 +20,7 @@ from guanlan.core.trader.event import EventEngine, Event
 from guanlan.core.trader.engine import MainEngine
 from guanlan.core.setting import account
 from guanlan.core.setting.contract import load_contracts
+from guanlan.core.utils.common import flush_json_files, get_file_path
 from guanlan.core.events import signal_bus
 
 
@@ -52,12 +55,19 @@ class AppEngine:
         # 正在连接中的环境（防止重复点击）
         self._connecting: set[str] = set()
 
+        # 账户配置缓存（按文件修改时间失效）
+        self._config_cache: dict[str, Any] | None = None
+        self._config_mtime: int = 0
+
+        # 行情网关名缓存（账户配置文件修改时间变化时重新计算，-1 表示尚未计算）
+        self._market_gateway_cached: str = ""
+        self._market_gateway_mtime: int = -1
+
         # 品种手续费配置缓存（启动时加载，供手续费计算使用）
         self.contracts: dict = load_contracts()
 
-        # 全局合约代码表（所有网关推送的合约汇总）
-        self._vt_symbols: list[str] = []
-        self._vt_symbols_set: set[str] = set()
+        # 全局合约代码表（所有网关推送的合约汇总，dict 保持插入顺序）
+        self._vt_symbols: dict[str, None] = {}
 
         # 行情订阅管理（合约到齐前排队，到齐后一次性补订）
         self._contract_ready: bool = False
@@ -89,8 +99,7 @@ class AppEngine:
             self.main_engine.write_log(f"环境正在连接中，请勿重复操作：{env_name}", "AppEngine")
             return
 
-        config = account.load_config()
-        envs = account.get_accounts(config)
+        envs = account.get_accounts(self._get_config())
         setting = envs.get(env_name, {})
 
         if not setting:
@@ -105,6 +114,18 @@ class AppEngine:
 
         self.main_engine.connect(setting, gateway_name)
 
+    def _get_config(self) -> dict[str, Any]:
+        """获取账户配置（文件未修改时直接返回缓存）"""
+        try:
+            mtime = get_file_path(account.SETTING_FILENAME).stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+
+        if self._config_cache is None or mtime != self._config_mtime:
+            self._config_cache = account.load_config()
+            self._config_mtime = mtime
+        return self._config_cache
+
     def disconnect(self, env_name: str) -> None:
         """断开指定环境的 CTP 连接"""
         self._connecting.discard(env_name)
@@ -146,8 +167,15 @@ class AppEngine:
 
     @property
     def market_gateway(self) -> str:
-        """行情数据源的网关名（环境名）"""
-        config = account.load_config()
+        """行情数据源的网关名（环境名），账户配置修改后自动重新查找"""
+        config = self._get_config()
+        if self._market_gateway_mtime != self._config_mtime:
+            self._market_gateway_cached = self._compute_market_gateway(config)
+            self._market_gateway_mtime = self._config_mtime
+        return self._market_gateway_cached
+
+    def _compute_market_gateway(self, config: dict[str, Any]) -> str:
+        """遍历环境列表查找行情数据源"""
         envs = account.get_accounts(config)
         for env_name, data in envs.items():
             if account.is_market_source(data):
@@ -156,8 +184,7 @@ class AppEngine:
 
     def auto_connect(self) -> None:
         """自动连接标记了自动登录的账户"""
-        config = account.load_config()
-        envs = account.get_accounts(config)
+        envs = account.get_accounts(self._get_config())
         for env_name, data in envs.items():
             if account.is_auto_login(data):
                 self.connect(env_name)
@@ -175,10 +202,13 @@ class AppEngine:
         except Exception:
             pass
 
+        # 写入尚未落盘的延迟保存（合约 / 收藏等）
+        flush_json_files()
+
     @property
     def vt_symbols(self) -> list[str]:
         """所有已收到的合约代码列表"""
-        return self._vt_symbols
+        return list(self._vt_symbols)
 
     def _on_contract(self, event: Event) -> None:
         """合约事件处理（连接状态跟踪 + 合约累积）"""
@@ -191,22 +221,26 @@ class AppEngine:
             self._connections[gateway_name] = gateway_name
             signal_bus.account_connected.emit(gateway_name)
 
-        vt_symbol = f"{contract.symbol}.{contract.exchange.value}"
-
-        # 累积合约代码（O(1) 去重）
-        if vt_symbol not in self._vt_symbols_set:
-            self._vt_symbols_set.add(vt_symbol)
-            self._vt_symbols.append(vt_symbol)
+        # 累积合约代码（单次哈希去重，已存在的键保持原有顺序）
+        self._vt_symbols.setdefault(contract.vt_symbol)
 
     def _on_contract_inited(self, event: Event) -> None:
         """合约查询完毕：标记就绪 + 补订排队中的品种"""
         self._contract_ready = True
 
-        # 补订排队中的品种
+        # 补订排队中的品种（行情网关只查找一次）
         pending = self._pending_subscribes
         self._pending_subscribes = []
+        if not pending:
+            return
+
+        market_gw = self.market_gateway
+        if not market_gw:
+            return
+
         for vt_symbol in pending:
-            self.subscribe(vt_symbol)
+            if vt_symbol not in self._subscribed:
+                self._send_subscribe(vt_symbol, market_gw)
 
     def subscribe(self, vt_symbol: str) -> bool:
         """统一行情订阅入口
@@ -234,15 +268,19 @@ class AppEngine:
                 self._pending_subscribes.append(vt_symbol)
             return True
 
-        contract: ContractData | None = self.main_engine.get_contract(vt_symbol)
-        if not contract:
-            return False
-
         market_gw = self.market_gateway
         if not market_gw:
             return False
 
+        return self._send_subscribe(vt_symbol, market_gw)
+
+    def _send_subscribe(self, vt_symbol: str, gateway_name: str) -> bool:
+        """查合约信息并向指定网关发送订阅请求，成功后记入已订阅"""
+        contract: ContractData | None = self.main_engine.get_contract(vt_symbol)
+        if not contract:
+            return False
+
         req = SubscribeRequest(symbol=contract.symbol, exchange=contract.exchange)
-        self.main_engine.subscribe(req, market_gw)
+        self.main_engine.subscribe(req, gateway_name)
         self._subscribed.add(vt_symbol)
         return True
@@ -73,6 +73,16 @@ COLOR_DOWN = "#26A69A"        # 跌 / 做空 — 绿色
 COLOR_UP_ALPHA = "rgba(239, 83, 80, 0.5)"    # 涨（半透明，量能柱用）
 COLOR_DOWN_ALPHA = "rgba(38, 166, 154, 0.5)"  # 跌（半透明，量能柱用）
 
+# ============================================================================
+# 音频配置常量
+# ============================================================================
+
+SOUND_FREQUENCY = 44100             # 采样率
+SOUND_BUFFER_SAMPLES = 512          # 混音缓冲区（约 12ms 延迟，默认 4096 约 90ms）
+SOUND_BUFFER_SAMPLES_FALLBACK = 1024  # 低性能设备初始化失败时的回退缓冲区
+SOUND_NUM_CHANNELS = 8              # 混音通道总数
+SOUND_RESERVED_CHANNELS = ("buy", "sell", "con_buy", "con_sell")  # 独占通道的交易音效
+
 
 
 # ============================================================================
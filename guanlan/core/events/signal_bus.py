@@ -41,7 +41,6 @@ class SignalBus(QObject):
     strategy_stopped = Signal(str)               # 策略停止
     strategy_removed = Signal(str)               # 策略移除
     strategy_params_changed = Signal(str, dict)  # 参数变化
-    strategy_state_updated = Signal(str, dict)   # 状态更新
     strategy_start_all = Signal()                # 启动所有策略
     strategy_stop_all = Signal()                 # 停止所有策略
 
@@ -52,7 +51,6 @@ class SignalBus(QObject):
     position_closed = Signal(dict)               # 平仓
 
     # ==================== 数据信号 ====================
-    bar_received = Signal(dict)                  # Bar 数据
     contract_loaded = Signal(list)               # 合约列表加载
     main_contract_updated = Signal(str, str)     # 主力合约更新 (品种, 合约)
 
@@ -67,7 +65,6 @@ class SignalBus(QObject):
     mica_enabled_changed = Signal(bool)          # Mica 效果开关变化
     show_message = Signal(str, str, str)         # 显示消息 (标题, 内容, 级别)
     show_tooltip = Signal(str, str, str)         # 显示提示 (标题, 内容, 级别)
-    status_message = Signal(str)                 # 状态栏消息
     play_sound = Signal(str)                     # 播放声音
     support_signal = Signal()                    # 打开支持页面
 
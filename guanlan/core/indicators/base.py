@@ -4,11 +4,12 @@
 
 BaseIndicatorParams: 指标参数基类（Pydantic 模型）
 BaseIndicator: 指标模板抽象基类
+RunningMean: 增量简单均线（on_bar 逐根 O(1) 更新）
 
 参照 CtaTemplate 的 Pydantic 模式设计：
 - 参数用 BaseModel + Field(title=...) 约束
 - 类变量声明 + __init__ 中 model_copy 实例隔离
-- on_init / on_bar 生命周期回调
+- on_init_arrays / on_bar 生命周期回调
 
 Author: 海山观澜
 """
@@ -16,13 +17,13 @@ Author: 海山观澜
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections import deque
+from math import isnan
+from typing import Iterable
 
+import numpy as np
 from pydantic import BaseModel
 
-if TYPE_CHECKING:
-    import numpy as np
-
 
 class BaseIndicatorParams(BaseModel, validate_assignment=True):
     """指标参数基类
@@ -37,13 +38,45 @@ class BaseIndicatorParams(BaseModel, validate_assignment=True):
     pass
 
 
+class RunningMean:
+    """增量简单均线
+
+    环形缓冲 + 滚动求和，每次 push 为 O(1)，
+    数据不足 n 个时返回 NaN（与 MyTT.MA 一致）。
+    """
+
+    __slots__ = ("n", "buf", "i", "sum", "full")
+
+    def __init__(self, n: int, values: Iterable[float] = ()) -> None:
+        self.n: int = n
+        self.buf: list[float] = [0.0] * n
+        self.i: int = 0
+        self.sum: float = 0.0
+        self.full: bool = False
+        for v in values:
+            self.push(v)
+
+    def push(self, x: float) -> float:
+        """追加一个值，返回最新均值"""
+        self.sum += x - self.buf[self.i]
+        self.buf[self.i] = x
+        self.i += 1
+        if self.i == self.n:
+            self.i = 0
+            self.full = True
+        return self.sum / self.n if self.full else float("nan")
+
+
 class BaseIndicator(ABC):
     """指标模板
 
     参照 CtaTemplate 设计：
     - Pydantic 参数模型 + Field 约束
     - 类变量声明 + __init__ 中 model_copy 实例隔离
-    - on_init / on_bar 生命周期回调
+    - on_init_arrays / on_bar 生命周期回调
+
+    参数实例化时只做浅拷贝（参数一般为 int/float/str 等不可变标量）。
+    含 list / dict 等可变字段的子类需在 __init__ 中自行深拷贝。
     """
 
     author: str = ""
@@ -74,8 +107,8 @@ class BaseIndicator(ABC):
         return 100
 
     def __init__(self) -> None:
-        # 类变量 → 实例变量（避免多实例共享）
-        self.params = self.__class__.params.model_copy(deep=True)
+        # 类变量 → 实例变量（避免多实例共享，标量字段浅拷贝即可）
+        self.params = self.__class__.params.model_copy()
         self.inited: bool = False
 
     def update_setting(self, setting: dict) -> None:
@@ -120,66 +153,57 @@ class BaseIndicator(ABC):
         window_size = max(self.lookback * window_factor, min_size)
         return data[-window_size:]
 
-    def _clean_nan(self, data: dict[str, list | "np.ndarray"]) -> dict[str, list]:
-        """清理数据中的 NaN 值，转换为 None
+    def _make_window(
+        self,
+        values: Iterable[float] = (),
+        window_factor: int = 3,
+        min_size: int = 100,
+    ) -> deque:
+        """创建定长计算窗口（环形缓冲）
+
+        窗口大小规则与 _get_compute_window 相同，超出后自动丢弃最旧数据：
+        每根 K 线追加为 O(1)，内存不随历史增长，也不必每次切片复制。
 
         Args:
-            data: 原始数据，值可以是 list 或 numpy array，可能包含 NaN
+            values: 初始数据（只保留最近的 N 个）
+            window_factor: 窗口大小倍数（相对于 lookback），默认 3
+            min_size: 最小窗口大小，默认 100
 
-        Returns:
-            清理后的数据，NaN 转换为 None
-        """
-        import numpy as np
-        cleaned = {}
-        for name, values in data.items():
-            if isinstance(values, np.ndarray):
-                cleaned[name] = [None if np.isnan(v) else v for v in values]
-            else:
-                # 已经是 list，检查每个元素
-                cleaned[name] = [
-                    None if (isinstance(v, float) and np.isnan(v)) else v
-                    for v in values
-                ]
-        return cleaned
-
-    def _filter_by_lookback(self, data: dict[str, list]) -> dict[str, list]:
-        """根据 lookback 过滤数据，前面不足的部分设为 None
+        示例::
 
-        此方法用于处理指标库（如 MyTT）在数据不足时仍返回不准确值的问题。
-        子类在 on_init 中计算完指标后，可调用此方法统一处理。
+            def _compute_init(self, bars):
+                closes = [b["close"] for b in bars]
+                self._closes = self._make_window(closes)
+                ...
 
-        Args:
-            data: 指标原始数据，格式 {"线名": [值列表], ...}
+            def _compute_bar(self, bar):
+                self._closes.append(bar["close"])
+                ma = MA(self._window_array(self._closes), self.params.period)
+                return {"MA": ma[-1]}
+        """
+        return deque(values, maxlen=max(self.lookback * window_factor, min_size))
 
-        Returns:
-            过滤后的数据，前 lookback-1 个值强制为 None
+    @staticmethod
+    def _window_array(window: deque) -> np.ndarray:
+        """窗口数据转为 float64 数组"""
+        return np.fromiter(window, dtype=np.float64, count=len(window))
 
-        示例::
+    def _filter_by_lookback(self, data: dict[str, list | np.ndarray]) -> dict[str, np.ndarray]:
+        """根据 lookback 过滤数据，前面不足的部分设为 NaN
 
-            def on_init(self, bars):
-                # 计算原始数据
-                raw_data = {"MA5": ma5_array, "MA20": ma20_array}
-                # 自动过滤前面不足 lookback 的值
-                return self._filter_by_lookback(raw_data)
+        此方法用于处理指标库（如 MyTT）在数据不足时仍返回不准确值的问题。
+        数据总量不足 lookback 时全部设为 NaN，否则前 lookback-1 个设为 NaN；
+        结果为 float64 数组，None 同样视为 NaN。
         """
         min_bars = self.lookback
 
-        # lookback=0 表示无最低要求，直接返回原始数据
-        if min_bars == 0:
-            return data
-
         filtered = {}
         for name, values in data.items():
-            if not values:
-                filtered[name] = []
-                continue
-
-            # 数据总量不足 lookback，全部设为 None
-            if len(values) < min_bars:
-                filtered[name] = [None] * len(values)
-            else:
-                # 数据足够，前 lookback-1 个设为 None，后面保留原值
-                filtered[name] = [None] * (min_bars - 1) + values[min_bars - 1:]
+            arr = np.array(values, dtype=np.float64)
+            n = len(arr)
+            head = n if n < min_bars else max(min_bars - 1, 0)
+            arr[:head] = np.nan
+            filtered[name] = arr
 
         return filtered
 
@@ -203,39 +227,29 @@ class BaseIndicator(ABC):
         """
         return []
 
-    def on_init(self, bars: list[dict]) -> dict[str, list]:
+    def on_init_arrays(self, bars: list[dict]) -> dict[str, np.ndarray]:
         """历史数据初始化（模板方法，自动处理数据对齐）
 
         此方法不应被子类重写。子类应实现 _compute_init() 方法。
 
         批量计算历史 K 线的指标值，用于首次加载图表。
-        只计算 display_offset 根数据用于显示，不计算全部历史。
+        结果为 float64 数组，无效值（含前 lookback-1 个）为 NaN，
+        由图表等调用方在序列化时自行处理。
 
         Args:
             bars: K 线数据列表 [{time, open, high, low, close, volume}, ...]
 
         Returns:
-            各线的完整数据 {"MA5": [值列表], "MA20": [值列表]}
+            各线的完整数据 {"MA5": array([...]), "MA20": array([...])}
         """
-        # 性能优化：只计算需要显示的数据
-        # display_offset 控制显示范围，无需计算全部历史
-        # 例如：有 10000 根历史，只计算最近 100 根用于初始显示
-
-        # 1. 子类计算原始数据（可能包含 NaN）
-        raw_data = self._compute_init(bars)
-
-        # 2. 自动清理 NaN → None
-        cleaned_data = self._clean_nan(raw_data)
-
-        # 3. 自动根据 lookback 过滤前面不足的数据
-        return self._filter_by_lookback(cleaned_data)
+        return self._filter_by_lookback(self._compute_init(bars))
 
     @abstractmethod
     def _compute_init(self, bars: list[dict]) -> dict[str, list | "np.ndarray"]:
         """计算历史数据的指标值（子类实现）
 
         子类只需实现计算逻辑，返回原始数据即可，不需要关心：
-        - NaN 转换（基类自动处理）
+        - 转换为 float64 数组（基类自动处理，None 视为 NaN）
         - lookback 过滤（基类自动处理）
         - 数据对齐（基类自动处理）
 
@@ -268,16 +282,11 @@ class BaseIndicator(ABC):
         # 子类计算原始值（可能包含 NaN）
         raw_data = self._compute_bar(bar)
 
-        # 自动清理 NaN → None
-        import numpy as np
-        cleaned_data = {}
-        for name, value in raw_data.items():
-            if isinstance(value, float) and np.isnan(value):
-                cleaned_data[name] = None
-            else:
-                cleaned_data[name] = value
-
-        return cleaned_data
+        # 自动清理 NaN → None（np.float64 是 float 子类，标量用 math.isnan 即可）
+        return {
+            name: None if (isinstance(value, float) and isnan(value)) else value
+            for name, value in raw_data.items()
+        }
 
     @abstractmethod
     def _compute_bar(self, bar: dict) -> dict[str, float]:
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+观澜量化 - 指标模块加载
+
+从 indicators/ 目录发现并按需加载指标模块，模块内 @register_indicator 完成注册。
+
+启动时不执行任何指标模块，只扫描源码中的 @register_indicator("名称")
+建立 名称 → 文件 的索引：按名称查询时只加载对应模块，
+列出全部指标时才加载其余模块。
+
+Author: 海山观澜
+"""
+
+import importlib.util
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from .registry import _INDICATOR_REGISTRY, _collecting, _register
+
+
+# 并行加载指标模块的最大线程数
+_MAX_LOAD_WORKERS: int = 8
+
+# 源码中的注册装饰器
+_REGISTER_PATTERN = re.compile(r"""@register_indicator\(\s*["'](.+?)["']\s*\)""")
+
+# 模块列表 [(模块名, 文件路径)]，按文件名排序；None 表示尚未扫描
+_modules: list[tuple[str, str]] | None = None
+
+# 指标名称 → (模块名, 文件路径)
+_index: dict[str, tuple[str, str]] = {}
+
+# 已加载的模块名
+_loaded: set[str] = set()
+
+
+def _scan() -> list[tuple[str, str]]:
+    """扫描 indicators/ 目录，建立指标名称索引（仅读源码，不执行）"""
+    global _modules
+    if _modules is not None:
+        return _modules
+
+    from guanlan.core.constants import PROJECT_ROOT
+
+    _modules = []
+    indicators_dir = PROJECT_ROOT / "indicators"
+    if not indicators_dir.is_dir():
+        return _modules
+
+    # scandir 一次遍历目录，只做字符串过滤，不为每个文件构造 Path
+    with os.scandir(indicators_dir) as it:
+        _modules = sorted(
+            (f"indicators.{e.name[:-3]}", e.path) for e in it
+            if e.name.endswith(".py") and not e.name.startswith("_") and e.is_file()
+        )
+
+    for module_name, filepath in _modules:
+        try:
+            with open(filepath, encoding="utf-8") as f:
+                source = f.read()
+        except OSError:
+            continue
+        for name in _REGISTER_PATTERN.findall(source):
+            _index[name] = (module_name, filepath)
+
+    return _modules
+
+
+def _load_module(module_name: str, filepath: str) -> list[tuple[str, type]]:
+    """加载单个指标模块，返回模块内登记的 (指标名称, 指标类)，由调用方注册"""
+    _loaded.add(module_name)
+    with _collecting() as pending:
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, filepath)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception:
+            pass
+    return pending
+
+
+def load_indicator(name: str) -> None:
+    """按名称加载指标所在模块
+
+    源码扫描未找到该名称（如名称为动态生成）时退回加载全部模块。
+    """
+    _scan()
+    entry = _index.get(name)
+    if entry is None:
+        load_indicators()
+    elif entry[0] not in _loaded:
+        for indicator_name, cls in _load_module(*entry):
+            _register(indicator_name, cls)
+
+
+def load_indicators() -> None:
+    """加载全部尚未加载的指标模块
+
+    各模块在线程池中并行加载，重叠文件读取和依赖导入；
+    线程池结束后才按文件名顺序统一注册，名称重复时由排在后面的文件覆盖，
+    结果与加载线程的完成先后无关，指标列表顺序也保持稳定。
+
+    指标模块会导入 guanlan.core.indicators，必须在该包初始化完成后调用，
+    否则工作线程会阻塞在包的导入锁上。
+    """
+    tasks = [task for task in _scan() if task[0] not in _loaded]
+
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(tasks))) as executor:
+            futures = [executor.submit(_load_module, *task) for task in tasks]
+
+        for future in futures:
+            for name, cls in future.result():
+                _register(name, cls)
+
+    order = {module_name: i for i, (module_name, _) in enumerate(_modules)}
+    items = sorted(
+        _INDICATOR_REGISTRY.items(),
+        key=lambda item: order.get(item[1].__module__, len(order)),
+    )
+    _INDICATOR_REGISTRY.clear()
+    _INDICATOR_REGISTRY.update(items)
@@ -3,33 +3,82 @@
 观澜量化 - 指标注册表
 
 @register_indicator 装饰器自动注册指标类。
+indicators/ 目录下的指标模块在查询时按需加载。
 
 Author: 海山观澜
 """
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
+from guanlan.core.utils.logger import get_logger
+
 if TYPE_CHECKING:
     from .base import BaseIndicator
 
+
+logger = get_logger("indicator")
+
 _INDICATOR_REGISTRY: dict[str, type[BaseIndicator]] = {}
 
+# 指标目录是否已全部加载
+_all_loaded: bool = False
+
+# 各线程正在收集的待注册指标（加载指标模块期间不直接写入注册表）
+_local = threading.local()
+
+
+def _register(name: str, cls: type[BaseIndicator]) -> None:
+    """写入注册表（名称重复时后注册的类覆盖先注册的类，来自不同模块时记录警告）"""
+    prev = _INDICATOR_REGISTRY.get(name)
+    if prev is not None and prev.__module__ != cls.__module__:
+        logger.warning(
+            f"指标名称重复，{prev.__module__}.{prev.__qualname__} "
+            f"被 {cls.__module__}.{cls.__qualname__} 覆盖: {name}"
+        )
+    _INDICATOR_REGISTRY[name] = cls
+
+
+@contextmanager
+def _collecting() -> Iterator[list[tuple[str, type[BaseIndicator]]]]:
+    """收集当前线程内登记的指标，由调用方按确定的顺序统一注册"""
+    pending: list[tuple[str, type[BaseIndicator]]] = []
+    _local.pending = pending
+    try:
+        yield pending
+    finally:
+        _local.pending = None
+
 
 def register_indicator(name: str):
-    """装饰器：注册指标类"""
+    """装饰器：注册指标类（名称重复时后注册的类覆盖先注册的类）"""
     def decorator(cls: type[BaseIndicator]) -> type[BaseIndicator]:
-        _INDICATOR_REGISTRY[name] = cls
+        pending = getattr(_local, "pending", None)
+        if pending is not None:
+            pending.append((name, cls))
+        else:
+            _register(name, cls)
         return cls
     return decorator
 
 
 def get_indicator(name: str) -> type[BaseIndicator]:
-    """获取指标类"""
+    """获取指标类（未注册时只加载该指标所在模块）"""
+    if name not in _INDICATOR_REGISTRY:
+        from .loader import load_indicator
+        load_indicator(name)
     return _INDICATOR_REGISTRY[name]
 
 
 def get_all_indicators() -> dict[str, type[BaseIndicator]]:
-    """获取所有已注册指标"""
+    """获取所有已注册指标（首次调用时加载全部指标模块）"""
+    global _all_loaded
+    if not _all_loaded:
+        _all_loaded = True
+        from .loader import load_indicators
+        load_indicators()
     return dict(_INDICATOR_REGISTRY)
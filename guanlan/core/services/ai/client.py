@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import threading
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
@@ -41,6 +42,39 @@ from guanlan.core.utils.logger import get_logger
 logger = get_logger("ai_client")
 
 
+# 共享 HTTP 连接池上限
+HTTP_MAX_CONNECTIONS: int = 100
+HTTP_MAX_KEEPALIVE: int = 50
+
+
+# 图片类型检测读取的文件头字节数 / 图片分块编码大小（须为 3 的倍数）
+_MIME_SNIFF_SIZE: int = 12
+_ENCODE_CHUNK_SIZE: int = 3 * 64 * 1024
+
+
+# 图片文件头 → MIME 类型（按首字节分组，每组只比较少数候选）
+_IMAGE_MAGIC: dict[int, tuple[tuple[bytes, str], ...]] = {
+    0xFF: ((b'\xff\xd8\xff', "image/jpeg"),),
+    0x89: ((b'\x89PNG\r\n\x1a\n', "image/png"),),
+    0x47: ((b'GIF87a', "image/gif"), (b'GIF89a', "image/gif")),
+}
+
+
+def _sniff_mime(head: bytes) -> str:
+    """通过文件头检测图片 MIME 类型，无法识别时默认 PNG"""
+    if not head:
+        return "image/png"
+
+    for magic, mime in _IMAGE_MAGIC.get(head[0], ()):
+        if head.startswith(magic):
+            return mime
+
+    # WebP: RIFF....WEBP
+    if head.startswith(b'RIFF') and head[8:12] == b'WEBP':
+        return "image/webp"
+    return "image/png"
+
+
 class AIClient:
     """
     AI 服务客户端
@@ -55,6 +89,49 @@ class AIClient:
     >>> print(response)
     """
 
+    # 事件循环 → 该循环内所有模型共享的 httpx.AsyncClient（复用 TCP/TLS 连接）
+    # 连接绑定创建时的事件循环，不能跨循环 / 线程复用，循环关闭后对应条目随即丢弃
+    _http_clients: dict[asyncio.AbstractEventLoop, Any] = {}
+    _http_lock = threading.Lock()
+
+    @classmethod
+    def _shared_http(cls) -> Any:
+        """获取当前事件循环共享的 httpx.AsyncClient（首次调用时创建，须在协程内调用）"""
+        loop = asyncio.get_running_loop()
+
+        with cls._http_lock:
+            http = cls._http_clients.get(loop)
+            if http is None:
+                import httpx
+
+                # 丢弃已关闭事件循环的客户端（其连接已无法使用）
+                for closed in [lp for lp in cls._http_clients if lp.is_closed()]:
+                    del cls._http_clients[closed]
+
+                # 国内 API 不需要代理，trust_env=False 忽略系统代理设置
+                http = cls._http_clients[loop] = httpx.AsyncClient(
+                    trust_env=False,
+                    limits=httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                    ),
+                )
+        return http
+
+    @classmethod
+    async def aclose_http(cls) -> None:
+        """关闭当前事件循环的共享 HTTP 客户端（一次性事件循环在关闭前调用）
+
+        Examples
+        --------
+        >>> loop.run_until_complete(AIClient.aclose_http())
+        >>> loop.close()
+        """
+        with cls._http_lock:
+            http = cls._http_clients.pop(asyncio.get_running_loop(), None)
+        if http is not None:
+            await http.aclose()
+
     def __init__(self, config: AIConfig | None = None):
         """
         初始化客户端
@@ -68,13 +145,18 @@ class AIClient:
             raise ImportError("请安装 openai 库: pip install openai>=1.0.0")
 
         self._config = config or get_config()
-        self._clients: dict[str, AsyncOpenAI] = {}
+        # (事件循环, 模型名称) → (客户端, 模型配置)，配置版本变化时整体失效
+        self._clients: dict[tuple[asyncio.AbstractEventLoop, str], tuple[AsyncOpenAI, ModelConfig]] = {}
+        self._clients_version: int = self._config.version
+
+        # 系统提示词 → 系统消息（同一提示词只构造一次）
+        self._sys_msgs: dict[str, dict] = {}
 
         logger.info(f"AI 客户端初始化，可用模型: {self._config.list_models()}")
 
     def _get_client(self, model_name: str) -> tuple[AsyncOpenAI, ModelConfig]:
         """
-        获取指定模型的 OpenAI 客户端
+        获取指定模型在当前事件循环内的 OpenAI 客户端（须在协程内调用）
 
         Parameters
         ----------
@@ -86,24 +168,68 @@ class AIClient:
         tuple[AsyncOpenAI, ModelConfig]
             客户端和配置
         """
+        # 模型配置被修改过，丢弃旧客户端
+        if self._clients_version != self._config.version:
+            self._clients.clear()
+            self._clients_version = self._config.version
+
+        # 复用当前事件循环内已创建的客户端
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get((loop, model_name))
+        if entry is not None:
+            return entry
+
+        # 丢弃已关闭事件循环的客户端
+        for key in [key for key in list(self._clients) if key[0].is_closed()]:
+            self._clients.pop(key, None)
+
         model_cfg = self._config.get_model_config(model_name)
 
         if not model_cfg.api_key:
             raise APIError(f"模型 {model_name} 未配置 API Key")
 
-        # 复用已创建的客户端
-        cache_key = f"{model_cfg.api_base}:{model_cfg.api_key[:8]}"
-        if cache_key not in self._clients:
-            import httpx
-            # 国内 API 不需要代理，trust_env=False 忽略系统代理设置
-            http_client = httpx.AsyncClient(trust_env=False)
-            self._clients[cache_key] = AsyncOpenAI(
-                api_key=model_cfg.api_key,
-                base_url=model_cfg.api_base,
-                http_client=http_client,
-            )
+        client = AsyncOpenAI(
+            api_key=model_cfg.api_key,
+            base_url=model_cfg.api_base,
+            http_client=self._shared_http(),
+        )
+        entry = self._clients[(loop, model_name)] = (client, model_cfg)
+        return entry
+
+    def _system_messages(self, system_prompt: str | None) -> list[dict]:
+        """新建消息列表，有系统提示词时以缓存的系统消息开头"""
+        if not system_prompt:
+            return []
+
+        msg = self._sys_msgs.get(system_prompt)
+        if msg is None:
+            msg = self._sys_msgs[system_prompt] = {"role": "system", "content": system_prompt}
+        return [msg]
+
+    def _prepare(
+        self,
+        message: str,
+        model: str | None,
+        system_prompt: str | None,
+        history: list[dict] | None,
+    ) -> tuple[str, AsyncOpenAI, ModelConfig, list[dict]]:
+        """对话请求公共准备：选择模型、获取客户端、构建消息列表
 
-        return self._clients[cache_key], model_cfg
+        Returns
+        -------
+        tuple[str, AsyncOpenAI, ModelConfig, list[dict]]
+            模型名称、客户端、模型配置、消息列表
+        """
+        model_name = model or self._config.default_model
+        client, model_cfg = self._get_client(model_name)
+
+        # 系统消息复用缓存的字典
+        messages = self._system_messages(system_prompt)
+        if history:
+            messages += history
+        messages.append({"role": "user", "content": message})
+
+        return model_name, client, model_cfg, messages
 
     def list_models(self) -> list[str]:
         """列出所有可用模型"""
@@ -166,19 +292,9 @@ class AIClient:
         ...     system_prompt="你是专业的量化分析师"
         ... )
         """
-        model_name = model or self._config.default_model
-        client, model_cfg = self._get_client(model_name)
-
-        # 构建消息列表
-        messages = []
-
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-
-        if history:
-            messages.extend(history)
-
-        messages.append({"role": "user", "content": message})
+        model_name, client, model_cfg, messages = self._prepare(
+            message, model, system_prompt, history,
+        )
 
         try:
             response = await client.chat.completions.create(
@@ -234,19 +350,9 @@ class AIClient:
         >>> async for chunk in client.chat_stream("分析市场"):
         ...     print(chunk, end="", flush=True)
         """
-        model_name = model or self._config.default_model
-        client, model_cfg = self._get_client(model_name)
-
-        # 构建消息列表
-        messages = []
-
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-
-        if history:
-            messages.extend(history)
-
-        messages.append({"role": "user", "content": message})
+        model_name, client, model_cfg, messages = self._prepare(
+            message, model, system_prompt, history,
+        )
 
         try:
             stream = await client.chat.completions.create(
@@ -323,10 +429,7 @@ class AIClient:
         image_url = self._encode_image(image)
 
         # 构建消息
-        messages = []
-
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        messages = self._system_messages(system_prompt)
 
         # GLM-4V 要求 image_url 在 text 前面
         messages.append({
@@ -370,28 +473,30 @@ class AIClient:
         if isinstance(image, str) and image.startswith(("http://", "https://")):
             return image
 
-        # 读取文件或使用二进制数据
-        if isinstance(image, bytes):
-            data = image
+        # 二进制数据直接编码；文件只先读文件头检测类型，再分块编码
+        if isinstance(image, (bytes, bytearray)):
+            mime_type = _sniff_mime(bytes(image[:_MIME_SNIFF_SIZE]))
+            size = len(image)
+            base64_data = base64.b64encode(image).decode("ascii")
         else:
             path = Path(image)
             if not path.exists():
                 raise FileNotFoundError(f"图片不存在: {image}")
-            data = path.read_bytes()
-
-        # 通过文件头检测实际 MIME 类型
-        mime_type = "image/png"  # 默认
-        if data[:3] == b'\xff\xd8\xff':
-            mime_type = "image/jpeg"
-        elif data[:8] == b'\x89PNG\r\n\x1a\n':
-            mime_type = "image/png"
-        elif data[:6] in (b'GIF87a', b'GIF89a'):
-            mime_type = "image/gif"
-        elif data[:4] == b'RIFF' and data[8:12] == b'WEBP':
-            mime_type = "image/webp"
-
-        base64_data = base64.b64encode(data).decode()
-        logger.debug(f"图片编码: {len(data)} bytes, MIME: {mime_type}")
+
+            with open(path, "rb") as f:
+                head = f.read(_MIME_SNIFF_SIZE)
+                mime_type = _sniff_mime(head)
+
+                # 分块大小为 3 的倍数，各块编码结果可直接拼接，
+                # 不必同时持有完整原始数据和编码结果
+                encoded = bytearray(base64.b64encode(head))
+                size = len(head)
+                while chunk := f.read(_ENCODE_CHUNK_SIZE):
+                    encoded += base64.b64encode(chunk)
+                    size += len(chunk)
+            base64_data = encoded.decode("ascii")
+
+        logger.debug(f"图片编码: {size} bytes, MIME: {mime_type}")
         return f"data:{mime_type};base64,{base64_data}"
 
     async def analyze_kline(
@@ -485,9 +590,10 @@ class AIClient:
         )
 
 
-# 全局客户端实例
+# 全局客户端实例（按解析后的配置路径缓存，复用各自的 HTTP 连接池）
 _client: AIClient | None = None
-_client_config_path: str | Path | None = None
+_client_config_path: Path | None = None
+_clients: dict[Path, AIClient] = {}
 
 
 def get_ai_client(config_path: str | Path | None = None) -> AIClient:
@@ -517,21 +623,19 @@ def get_ai_client(config_path: str | Path | None = None) -> AIClient:
     """
     global _client, _client_config_path
 
-    # 如果指定了新路径，重新创建客户端
-    if config_path is not None and config_path != _client_config_path:
-        _client_config_path = config_path
-        # 重置并使用新配置
-        from .config import reset_config, get_config
-        reset_config()
-        get_config(config_path)
-        _client = AIClient()
+    # 指定了路径：切换到该路径对应的客户端（已创建过则直接复用）
+    if config_path is not None:
+        key = Path(config_path).resolve()
+        if key != _client_config_path:
+            # 同步切换全局配置，保证 get_config() 与客户端一致
+            config = get_config(key)
+            if key not in _clients:
+                _clients[key] = AIClient(config)
+            _client = _clients[key]
+            _client_config_path = key
 
     if _client is None:
-        if config_path:
-            from .config import get_config
-            get_config(config_path)
         _client = AIClient()
-        _client_config_path = config_path
 
     return _client
 
@@ -541,6 +645,27 @@ def reset_ai_client() -> None:
     global _client, _client_config_path
     _client = None
     _client_config_path = None
+    _clients.clear()
+
+
+# 同步接口使用的后台事件循环（常驻线程，复用 HTTP 连接）
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    """获取后台事件循环（首次调用时启动守护线程）"""
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever,
+                name="AIEventLoop",
+                daemon=True,
+            ).start()
+    return _loop
 
 
 def chat_sync(
@@ -575,11 +700,11 @@ def chat_sync(
     >>> response = chat_sync("分析螺纹钢走势", config_path="config/ai.json")
     """
     client = get_ai_client(config_path)
-    return asyncio.run(client.chat(
-        message,
-        model=model,
-        system_prompt=system_prompt,
-    ))
+    future = asyncio.run_coroutine_threadsafe(
+        client.chat(message, model=model, system_prompt=system_prompt),
+        _ensure_loop(),
+    )
+    return future.result()
 
 
 __all__ = [
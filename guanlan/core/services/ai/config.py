@@ -5,11 +5,11 @@
 Author: 海山观澜
 """
 
-import copy
-import json
+import threading
 from pathlib import Path
 
 from guanlan.core.services.ai.models import ModelConfig, ConfigError
+from guanlan.core.utils.common import _json_dumps, _json_loads
 from guanlan.core.utils.logger import get_logger
 
 
@@ -64,6 +64,17 @@ DEFAULT_CONFIG = {
 }
 
 
+def _fresh_default() -> dict:
+    """复制默认配置模板
+
+    模板只有两层且叶子均为不可变值，逐层复制字典即可，无需 deepcopy。
+    """
+    return {
+        "default_model": DEFAULT_CONFIG["default_model"],
+        "models": {name: dict(cfg) for name, cfg in DEFAULT_CONFIG["models"].items()},
+    }
+
+
 def _get_default_config_path() -> Path:
     """获取默认配置文件路径"""
     from guanlan.core.constants import CONFIG_DIR
@@ -103,29 +114,60 @@ class AIConfig:
             self._filepath = Path(config_path)
 
         self._data: dict = {}
+        # 指向 self._data["models"]（_load 后固定，增删改直接作用于它）
+        self._models: dict[str, dict] = {}
+        # 模型配置版本号（增删改模型时递增，供客户端判断缓存是否失效）
+        self.version: int = 0
+
+        # 模型名称 / 支持图片 / 缺少 API Key 的模型索引（按配置顺序，模型增删改时重建）
+        self._model_names: set[str] = set()
+        self._vision_models: tuple[str, ...] = ()
+        self._missing_keys: tuple[str, ...] = ()
+
+        # 模型名称 → 已构造的 ModelConfig（模型增删改时失效）
+        self._model_cache: dict[str, ModelConfig] = {}
+
         self._load()
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """重建模型名称、图片模型、缺少 API Key 的模型索引"""
+        models = self._models
+        self._model_names = set(models)
+        self._vision_models = tuple(
+            name for name, cfg in models.items() if cfg.get("supports_vision", False)
+        )
+        self._missing_keys = tuple(
+            name for name, cfg in models.items() if not cfg.get("api_key")
+        )
 
     def _load(self) -> None:
         """加载配置文件"""
         if self._filepath.exists():
             try:
-                with open(self._filepath, encoding="utf-8") as f:
-                    self._data = json.load(f)
+                self._data = _json_loads(self._filepath.read_bytes())
                 logger.info(f"配置加载成功: {self._filepath}")
             except Exception as e:
                 logger.error(f"配置加载失败: {e}")
-                self._data = copy.deepcopy(DEFAULT_CONFIG)
+                self._data = _fresh_default()
         else:
-            # 创建默认配置
-            self._data = copy.deepcopy(DEFAULT_CONFIG)
-            self.save()
+            # 创建默认配置：模板序列化一次写入文件，再解析同一文本作为独立副本
+            text = _json_dumps(DEFAULT_CONFIG)
+            try:
+                self._filepath.parent.mkdir(parents=True, exist_ok=True)
+                self._filepath.write_bytes(text)
+            except Exception as e:
+                logger.error(f"配置保存失败: {e}")
+                raise ConfigError(f"配置保存失败: {e}")
+            self._data = _json_loads(text)
             logger.info(f"已创建默认配置: {self._filepath}")
 
+        self._models = self._data.setdefault("models", {})
+
     def save(self) -> None:
         """保存配置到文件"""
         try:
-            with open(self._filepath, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
+            self._filepath.write_bytes(_json_dumps(self._data))
             logger.info(f"配置保存成功: {self._filepath}")
         except Exception as e:
             logger.error(f"配置保存失败: {e}")
@@ -139,21 +181,17 @@ class AIConfig:
     @default_model.setter
     def default_model(self, model_name: str) -> None:
         """设置默认模型"""
-        if model_name not in self.list_models():
+        if model_name not in self._model_names:
             raise ConfigError(f"模型不存在: {model_name}")
         self._data["default_model"] = model_name
 
     def list_models(self) -> list[str]:
         """列出所有模型名称"""
-        return list(self._data.get("models", {}).keys())
+        return list(self._models)
 
     def list_vision_models(self) -> list[str]:
         """列出支持图片的模型"""
-        models = []
-        for name, cfg in self._data.get("models", {}).items():
-            if cfg.get("supports_vision", False):
-                models.append(name)
-        return models
+        return list(self._vision_models)
 
     def get_model_config(self, model_name: str) -> ModelConfig:
         """
@@ -173,11 +211,18 @@ class AIConfig:
         ------
         ConfigError
             模型不存在时抛出
+
+        Notes
+        -----
+        返回的对象按名称缓存共享，只读使用；修改请调用 update_model。
         """
-        models = self._data.get("models", {})
-        if model_name not in models:
-            raise ConfigError(f"模型不存在: {model_name}")
-        return ModelConfig.from_dict(models[model_name])
+        model_cfg = self._model_cache.get(model_name)
+        if model_cfg is None:
+            models = self._models
+            if model_name not in models:
+                raise ConfigError(f"模型不存在: {model_name}")
+            model_cfg = self._model_cache[model_name] = ModelConfig.from_dict(models[model_name])
+        return model_cfg
 
     def add_model(self, name: str, config: ModelConfig) -> None:
         """
@@ -190,9 +235,10 @@ class AIConfig:
         config : ModelConfig
             模型配置
         """
-        if "models" not in self._data:
-            self._data["models"] = {}
-        self._data["models"][name] = config.to_dict()
+        self._models[name] = config.to_dict()
+        self._model_cache.pop(name, None)
+        self.version += 1
+        self._reindex()
         logger.info(f"已添加模型: {name}")
 
     def update_model(self, name: str, **kwargs) -> None:
@@ -206,13 +252,17 @@ class AIConfig:
         **kwargs
             要更新的配置项
         """
-        models = self._data.get("models", {})
-        if name not in models:
+        try:
+            target = self._models[name]
+        except KeyError:
             raise ConfigError(f"模型不存在: {name}")
 
         for key, value in kwargs.items():
-            if key in models[name]:
-                models[name][key] = value
+            if key in target:
+                target[key] = value
+        self._model_cache.pop(name, None)
+        self.version += 1
+        self._reindex()
         logger.info(f"已更新模型配置: {name}")
 
     def remove_model(self, name: str) -> None:
@@ -224,9 +274,10 @@ class AIConfig:
         name : str
             模型名称
         """
-        models = self._data.get("models", {})
-        if name in models:
-            del models[name]
+        if self._models.pop(name, None) is not None:
+            self._model_cache.pop(name, None)
+            self.version += 1
+            self._reindex()
             logger.info(f"已移除模型: {name}")
 
     def validate(self) -> list[str]:
@@ -238,16 +289,14 @@ class AIConfig:
         list[str]
             缺少 API Key 的模型列表
         """
-        missing = []
-        for name, cfg in self._data.get("models", {}).items():
-            if not cfg.get("api_key"):
-                missing.append(name)
-        return missing
+        return list(self._missing_keys)
 
 
-# 全局配置实例
+# 全局配置实例（按解析后的配置路径缓存，同一文件只解析一次）
 _config: AIConfig | None = None
-_config_path: str | Path | None = None
+_config_path: Path | None = None
+_configs: dict[Path, AIConfig] = {}
+_config_lock = threading.Lock()
 
 
 def get_config(config_path: str | Path | None = None) -> AIConfig:
@@ -274,23 +323,36 @@ def get_config(config_path: str | Path | None = None) -> AIConfig:
     """
     global _config, _config_path
 
-    # 如果指定了新路径，重新加载
-    if config_path is not None and config_path != _config_path:
-        _config_path = config_path
-        _config = AIConfig(config_path)
+    # 快速路径：未指定路径且已有实例，无需加锁
+    config = _config
+    if config_path is None and config is not None:
+        return config
+
+    # 慢速路径：加锁后再检查，避免多线程重复解析配置文件
+    with _config_lock:
+        # 指定了路径：切换到该路径对应的实例（已加载过则直接复用）
+        if config_path is not None:
+            key = Path(config_path).resolve()
+            if key != _config_path:
+                if key not in _configs:
+                    _configs[key] = AIConfig(key)
+                _config = _configs[key]
+                _config_path = key
 
-    # 首次调用或需要创建
-    if _config is None:
-        _config = AIConfig(_config_path)
+        # 首次调用或需要创建
+        if _config is None:
+            _config = AIConfig(_config_path)
 
-    return _config
+        return _config
 
 
 def reset_config() -> None:
     """重置全局配置（用于测试或切换配置文件）"""
     global _config, _config_path
-    _config = None
-    _config_path = None
+    with _config_lock:
+        _config = None
+        _config_path = None
+        _configs.clear()
 
 
 __all__ = [
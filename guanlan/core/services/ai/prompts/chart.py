@@ -95,14 +95,10 @@ def format_chart_analysis_prompt(state: dict, symbol: str, current_price: float)
 
     for name, data in state.items():
         # 格式化数值
-        values = data.get("values", {})
-        values_parts = []
-        for k, v in values.items():
-            if v is not None:
-                values_parts.append(f"{k}={v:.2f}")
-            else:
-                values_parts.append(f"{k}=None")
-        values_str = ", ".join(values_parts)
+        values_str = ", ".join(
+            f"{k}={v:.2f}" if v is not None else f"{k}=None"
+            for k, v in data.get("values", {}).items()
+        )
 
         # 格式化信号
         signal = data.get("signal")
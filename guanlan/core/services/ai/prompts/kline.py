@@ -5,6 +5,14 @@
 Author: 海山观澜
 """
 
+from collections import deque
+from itertools import islice
+from math import inf
+from operator import itemgetter
+from typing import Sequence
+
+import numpy as np
+
 
 KLINE_ANALYSIS_SYSTEM = """你是一位专业的技术分析师，擅长 K 线形态和量价分析。
 
@@ -32,6 +40,7 @@ KLINE_IMAGE_SYSTEM = """你是一位专业的技术分析师，擅长从 K 线
 请用专业但易懂的语言进行分析。"""
 
 
+# K 线数据提示词模板（format_kline_prompt 按此模板输出，统计值传入前已格式化为字符串）
 KLINE_DATA_TEMPLATE = """
 ## K 线数据分析
 
@@ -57,8 +66,60 @@ KLINE_DATA_TEMPLATE = """
 """
 
 
+# K 线表格表头 / 行格式
+_TABLE_HEADER = (
+    "| 时间 | 开盘 | 最高 | 最低 | 收盘 | 成交量 |\n"
+    "|------|------|------|------|------|--------|"
+)
+_BAR_ROW = "| {} | {:.2f} | {:.2f} | {:.2f} | {:.2f} | {:.0f} |".format
+
+
+# K 线必需字段
+_REQUIRED_FIELDS = frozenset(("open", "high", "low", "close", "volume"))
+
+
+def _format_bar_row(bar: dict) -> str:
+    """格式化单根 K 线为表格行"""
+    dt = bar.get("datetime", "")
+    if hasattr(dt, "strftime"):
+        dt = dt.strftime("%m-%d %H:%M")
+    return _BAR_ROW(dt, bar["open"], bar["high"], bar["low"], bar["close"], bar["volume"])
+
+
+# K 线数量超过此值时用 NumPy 计算统计信息
+_NUMPY_STATS_THRESHOLD: int = 500
+
+_STATS_DTYPE = np.dtype([("h", "f8"), ("l", "f8"), ("v", "f8")])
+
+
+# 取最高价、最低价、成交量
+_get_hlv = itemgetter("high", "low", "volume")
+
+
+def _kline_stats(kline_data: Sequence[dict] | deque[dict]) -> tuple[float, float, float]:
+    """单次遍历求最高价、最低价、平均成交量，不构造中间列表（kline_data 非空）"""
+    n = len(kline_data)
+
+    # 数据量大时一次转换为结构化数组，由 NumPy 完成归约
+    if n > _NUMPY_STATS_THRESHOLD:
+        arr = np.fromiter(map(_get_hlv, kline_data), dtype=_STATS_DTYPE, count=n)
+        return float(arr["h"].max()), float(arr["l"].min()), float(arr["v"].mean())
+
+    high_max = -inf
+    low_min = inf
+    volume_sum = 0
+    for high, low, volume in map(_get_hlv, kline_data):
+        if high > high_max:
+            high_max = high
+        if low < low_min:
+            low_min = low
+        volume_sum += volume
+
+    return high_max, low_min, volume_sum / n
+
+
 def format_kline_prompt(
-    kline_data: list[dict],
+    kline_data: Sequence[dict] | deque[dict],
     symbol: str = "",
     interval: str = "",
     strategy: str = "趋势跟踪",
@@ -69,8 +130,9 @@ def format_kline_prompt(
 
     Parameters
     ----------
-    kline_data : list[dict]
-        K 线数据列表，每条包含 datetime, open, high, low, close, volume
+    kline_data : Sequence[dict] | deque[dict]
+        K 线数据列表，每条包含 datetime, open, high, low, close, volume；
+        逐根推送的场景可直接传入 deque(maxlen=N) 滚动窗口
     symbol : str
         合约代码
     interval : str
@@ -84,39 +146,37 @@ def format_kline_prompt(
     -------
     str
         格式化后的提示词
+
+    Raises
+    ------
+    ValueError
+        K 线缺少 open/high/low/close/volume 字段
     """
     if not kline_data:
         return "无 K 线数据"
 
+    # 只校验首根 K 线的字段，之后统一按下标取值
+    missing = _REQUIRED_FIELDS - kline_data[0].keys()
+    if missing:
+        raise ValueError(f"K 线数据缺少字段: {', '.join(sorted(missing))}")
+
     # 取最近的数据
-    recent_data = kline_data[-recent_count:] if len(kline_data) > recent_count else kline_data
+    if len(kline_data) <= recent_count:
+        recent_data = kline_data
+    elif isinstance(kline_data, deque):
+        # deque 不支持切片，从尾部反向取 N 根再翻转
+        recent_data = list(islice(reversed(kline_data), recent_count))[::-1]
+    else:
+        recent_data = kline_data[-recent_count:]
 
     # 构建表格
-    lines = ["| 时间 | 开盘 | 最高 | 最低 | 收盘 | 成交量 |"]
-    lines.append("|------|------|------|------|------|--------|")
-
-    for bar in recent_data:
-        dt = bar.get("datetime", "")
-        if hasattr(dt, "strftime"):
-            dt = dt.strftime("%m-%d %H:%M")
-        lines.append(
-            f"| {dt} | {bar.get('open', 0):.2f} | "
-            f"{bar.get('high', 0):.2f} | {bar.get('low', 0):.2f} | "
-            f"{bar.get('close', 0):.2f} | {bar.get('volume', 0):.0f} |"
-        )
-
-    kline_table = "\n".join(lines)
+    # 表头与各行一次性放入列表后单次 join，不再另行拼接表头
+    kline_table = "\n".join([_TABLE_HEADER, *map(_format_bar_row, recent_data)])
 
     # 统计信息
-    all_highs = [bar.get("high", 0) for bar in kline_data]
-    all_lows = [bar.get("low", 0) for bar in kline_data]
-    all_volumes = [bar.get("volume", 0) for bar in kline_data]
-
-    high_max = max(all_highs) if all_highs else 0
-    low_min = min(all_lows) if all_lows else 0
+    high_max, low_min, avg_volume = _kline_stats(kline_data)
     price_range = high_max - low_min
     price_range_pct = (price_range / low_min * 100) if low_min > 0 else 0
-    avg_volume = sum(all_volumes) / len(all_volumes) if all_volumes else 0
 
     # 时间范围
     start_time = kline_data[0].get("datetime", "")
@@ -39,30 +39,45 @@ _ALERTS: dict[tuple[int, int], SoundType] = {
     (2, 30):  "end_0",     # 夜盘收盘（02:30品种）
 }
 
-# 当天已触发的提醒（每天重置）
-_fired: set[tuple[int, int]] = set()
+# 按分钟索引的提醒表：hour * 60 + minute → 音效类型（无提醒为 None）
+_ALERT_TABLE: list[SoundType | None] = [None] * 1440
+for (_hour, _minute), _sound in _ALERTS.items():
+    _ALERT_TABLE[_hour * 60 + _minute] = _sound
+
+# 当天已触发的提醒（按分钟索引，每天重置）
+_fired_mask = bytearray(1440)
 _fired_date: date | None = None
 
+# 当天是否交易日（日期切换时查询一次）
+_is_trading_today: bool = False
+
 
-def check(now: time) -> None:
+def check(now: time, today: date | None = None) -> None:
     """检查当前时刻是否需要播放提醒音效
 
     每秒调用一次，匹配 HH:MM 触发，同一时刻每天只触发一次。
-    非交易日静默（结果按天缓存，不重复查询日历）。
+    非提醒时刻只做一次列表索引即返回，不取日期、不查日历；
+    非交易日静默（日期切换时查询一次日历）。
+
+    today 为调用方已有的当天日期，省略时取 date.today()。
     """
-    global _fired, _fired_date
+    global _fired_date, _is_trading_today
 
-    today = date.today()
+    idx = now.hour * 60 + now.minute
+    sound = _ALERT_TABLE[idx]
+    if sound is None:
+        return
 
+    if today is None:
+        today = date.today()
     if _fired_date != today:
-        _fired = set()
+        _fired_mask[:] = bytes(1440)
         _fired_date = today
+        _is_trading_today = is_trading_day(today)
 
-    # 非交易日不提醒（is_trading_day 内部按天缓存）
-    if not is_trading_day(today):
+    # 非交易日不提醒
+    if not _is_trading_today or _fired_mask[idx]:
         return
 
-    key = (now.hour, now.minute)
-    if key in _ALERTS and key not in _fired:
-        _fired.add(key)
-        play_sound(_ALERTS[key])
+    _fired_mask[idx] = 1
+    play_sound(sound)
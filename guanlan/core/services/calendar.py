@@ -4,6 +4,8 @@
 
 基于 pandas_market_calendars (SSE) 提供交易日判断，
 查询结果按日期缓存，同一天内只查一次。
+日历库在首次未命中缓存时才导入，不拖慢导入本模块的进程启动。
+交易日按前后 90 天批量查询，区间内的判断直接查集合。
 
 Author: 海山观澜
 """
@@ -14,14 +16,54 @@ from guanlan.core.utils.logger import get_simple_logger
 
 logger = get_simple_logger("calendar", level=20)
 
-try:
-    import pandas_market_calendars as mcal
-    _calendar = mcal.get_calendar("SSE")
-    _available = True
-except Exception:
-    _calendar = None
-    _available = False
-    logger.warning("pandas_market_calendars 不可用，交易日判断回退为工作日判断")
+# 交易所日历（None 表示尚未加载）
+_calendar = None
+_available: bool | None = None
+
+
+def _ensure_calendar() -> bool:
+    """首次使用时加载交易所日历，返回是否可用"""
+    global _calendar, _available
+
+    if _available is None:
+        try:
+            import pandas_market_calendars as mcal
+            _calendar = mcal.get_calendar("SSE")
+            _available = True
+        except Exception:
+            _available = False
+            logger.warning("pandas_market_calendars 不可用，交易日判断回退为工作日判断")
+
+    return _available
+
+
+# 每次批量查询向前 / 向后覆盖的天数
+_RANGE_DAYS: int = 90
+
+# 已查询区间内的交易日，及区间范围（None 表示尚未查询）
+_trading_days: set[date] = set()
+_range_loaded: tuple[date, date] | None = None
+
+
+def _load_range(d: date) -> None:
+    """批量查询交易日，把已加载区间扩展到覆盖指定日期"""
+    global _range_loaded
+
+    span = timedelta(days=_RANGE_DAYS)
+    if _range_loaded is None:
+        start, end = d - span, d + span
+    elif d < _range_loaded[0]:
+        start, end = d - span, _range_loaded[0] - timedelta(days=1)
+    else:
+        start, end = _range_loaded[1] + timedelta(days=1), d + span
+
+    schedule = _calendar.schedule(start_date=start.isoformat(), end_date=end.isoformat())
+    _trading_days.update(schedule.index.date)
+
+    if _range_loaded is None:
+        _range_loaded = (start, end)
+    else:
+        _range_loaded = (min(start, _range_loaded[0]), max(end, _range_loaded[1]))
 
 
 # 缓存：日期 → 是否交易日
@@ -40,10 +82,10 @@ def is_trading_day(d: date | None = None) -> bool:
     if d in _cache:
         return _cache[d]
 
-    if _available:
-        date_str = d.strftime("%Y-%m-%d")
-        schedule = _calendar.schedule(start_date=date_str, end_date=date_str)
-        result = len(schedule) > 0
+    if _ensure_calendar():
+        if _range_loaded is None or not (_range_loaded[0] <= d <= _range_loaded[1]):
+            _load_range(d)
+        result = d in _trading_days
     else:
         result = d.weekday() < 5
 
@@ -5,25 +5,35 @@
 Author: 海山观澜
 """
 
+import heapq
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
+from itertools import count, islice
 from threading import Event, Lock, Thread
 from typing import Any
 
-try:
-    import schedule
-    SCHEDULE_AVAILABLE = True
-except ImportError:
-    SCHEDULE_AVAILABLE = False
-
 from guanlan.core.utils.logger import get_logger
 
 
 logger = get_logger("scheduler", level=20)
 
 
+# 调度线程单次最长休眠（秒），无任务时也按此间隔醒来
+_MAX_IDLE_WAIT: float = 60.0
+
+# 时间单位 → 秒数
+_UNIT_SECONDS: dict[str, int] = {
+    "seconds": 1,
+    "minutes": 60,
+    "hours": 3600,
+    "days": 86400,
+}
+
+
 @dataclass
 class TaskRecord:
     """任务执行记录"""
@@ -38,7 +48,8 @@ class TaskScheduler:
     """
     定时任务调度器（单例模式）
 
-    基于 schedule 库，支持动态添加/删除任务、任务执行历史记录
+    按 (下次执行时间, 序号, 任务 ID) 维护最小堆，调度线程只弹出到期任务，
+    并休眠到堆顶任务到期；支持动态添加/删除任务、任务执行历史记录
 
     Examples
     --------
@@ -71,24 +82,23 @@ class TaskScheduler:
         if self._initialized:
             return
 
-        if not SCHEDULE_AVAILABLE:
-            logger.warning("schedule 库未安装，定时任务功能不可用")
-            self._available = False
-            self._initialized = True
-            return
-
         self._available = True
         self._running = False
         self._stop_flag = Event()
+        self._wakeup = Event()             # 停止 / 任务变更时唤醒调度线程
         self._thread: Thread | None = None
-        self._lock = Lock()
+        self._lock = Lock()                # 保护启动 / 停止
 
-        # 任务管理
-        self._tasks: dict[str, schedule.Job] = {}
+        # 任务管理：任务 ID → (间隔秒数, 绑定参数的执行函数, 序号)
+        # 堆中条目为 (下次执行时间, 序号, 任务 ID)，已移除任务的条目弹出时丢弃
+        self._tasks: dict[str, tuple[float, Callable[[], None], int]] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = count()
+        self._task_lock = Lock()           # 保护 _tasks 与 _heap
 
-        # 任务执行历史（最多保留 100 条）
-        self._history: list[TaskRecord] = []
+        # 任务执行历史（最多保留 100 条，超出自动丢弃最旧记录）
         self._max_history = 100
+        self._history: deque[TaskRecord] = deque(maxlen=self._max_history)
 
         logger.info("定时任务调度器初始化成功")
         self._initialized = True
@@ -160,6 +170,7 @@ class TaskScheduler:
                 return False
 
             self._stop_flag.clear()
+            self._wakeup.clear()
             self._thread = Thread(target=self._run_loop, daemon=True)
             self._thread.start()
             self._running = True
@@ -192,6 +203,7 @@ class TaskScheduler:
 
         with self._lock:
             self._stop_flag.set()
+            self._wakeup.set()
 
             if self._thread and self._thread.is_alive():
                 self._thread.join(timeout)
@@ -247,48 +259,38 @@ class TaskScheduler:
             logger.error("调度器不可用")
             return False
 
-        with self._lock:
+        unit_seconds = _UNIT_SECONDS.get(unit)
+        if unit_seconds is None:
+            logger.error(f"不支持的时间单位: {unit}")
+            return False
+        interval_s = float(interval * unit_seconds)
+
+        # 绑定执行参数以记录执行历史（partial 为 C 实现，调用开销低于闭包）
+        bound_task = partial(self._execute_task, task_id, task_func.__name__, task_func, kwargs)
+
+        # 锁内只做查重与入堆
+        with self._task_lock:
             if task_id in self._tasks:
                 logger.warning(f"任务已存在: {task_id}")
                 return False
 
-            try:
-                # 创建任务
-                if unit == "seconds":
-                    job = schedule.every(interval).seconds
-                elif unit == "minutes":
-                    job = schedule.every(interval).minutes
-                elif unit == "hours":
-                    job = schedule.every(interval).hours
-                elif unit == "days":
-                    job = schedule.every(interval).days
-                else:
-                    logger.error(f"不支持的时间单位: {unit}")
-                    return False
-
-                # 包装任务函数以记录执行历史
-                def wrapped_task():
-                    self._execute_task(task_id, task_func.__name__, task_func, **kwargs)
+            seq = next(self._seq)
+            self._tasks[task_id] = (interval_s, bound_task, seq)
+            heapq.heappush(self._heap, (time.monotonic() + interval_s, seq, task_id))
 
-                job.do(wrapped_task)
+        # 唤醒调度线程重新计算休眠时间
+        self._wakeup.set()
 
-                # 保存任务
-                self._tasks[task_id] = job
+        logger.info(
+            f"添加定时任务: {task_id}, 间隔: {interval} {unit}, "
+            f"函数: {task_func.__name__}"
+        )
 
-                logger.info(
-                    f"添加定时任务: {task_id}, 间隔: {interval} {unit}, "
-                    f"函数: {task_func.__name__}"
-                )
+        # 立即执行一次（锁外执行，任务耗时不阻塞其他调用方）
+        if start_immediately:
+            bound_task()
 
-                # 立即执行一次
-                if start_immediately:
-                    wrapped_task()
-
-                return True
-
-            except Exception as e:
-                logger.error(f"添加任务失败: {e}")
-                return False
+        return True
 
     def remove_task(self, task_id: str) -> bool:
         """
@@ -312,20 +314,14 @@ class TaskScheduler:
         if not self._available:
             return False
 
-        with self._lock:
-            if task_id not in self._tasks:
+        # 堆中的条目保留，到期弹出时发现任务已移除即丢弃
+        with self._task_lock:
+            if self._tasks.pop(task_id, None) is None:
                 logger.warning(f"任务不存在: {task_id}")
                 return False
 
-            try:
-                job = self._tasks.pop(task_id)
-                schedule.cancel_job(job)
-                logger.info(f"移除定时任务: {task_id}")
-                return True
-
-            except Exception as e:
-                logger.error(f"移除任务失败: {e}")
-                return False
+        logger.info(f"移除定时任务: {task_id}")
+        return True
 
     def get_tasks(self) -> list[str]:
         """
@@ -341,7 +337,7 @@ class TaskScheduler:
         >>> scheduler.get_tasks()
         ['task1', 'task2']
         """
-        with self._lock:
+        with self._task_lock:
             return list(self._tasks.keys())
 
     def clear_tasks(self) -> None:
@@ -355,10 +351,10 @@ class TaskScheduler:
         if not self._available:
             return
 
-        with self._lock:
-            schedule.clear()
+        with self._task_lock:
             self._tasks.clear()
-            logger.info("已清除所有定时任务")
+            self._heap.clear()
+        logger.info("已清除所有定时任务")
 
     def get_history(self, limit: int = 50) -> list[TaskRecord]:
         """
@@ -367,12 +363,12 @@ class TaskScheduler:
         Parameters
         ----------
         limit : int, default 50
-            返回的记录数量
+            返回最近的记录数量（最多 _max_history 条，<= 0 返回空列表）
 
         Returns
         -------
         list[TaskRecord]
-            执行历史记录
+            执行历史记录（按执行先后排列，最新的在末尾）
 
         Examples
         --------
@@ -380,8 +376,13 @@ class TaskScheduler:
         >>> for record in history:
         ...     print(f"{record.task_name}: {record.success}")
         """
-        with self._lock:
-            return self._history[-limit:]
+        # deque(maxlen) 即环形缓冲区，追加与复制均为原子操作，无需加锁；
+        # 从尾部反向只取 limit 条，不必跳过前面的旧记录
+        if limit <= 0:
+            return []
+        records = list(islice(reversed(self._history), limit))
+        records.reverse()
+        return records
 
     def clear_history(self) -> None:
         """
@@ -391,29 +392,56 @@ class TaskScheduler:
         --------
         >>> scheduler.clear_history()
         """
-        with self._lock:
-            self._history.clear()
-            logger.info("已清除任务执行历史")
+        self._history.clear()
+        logger.info("已清除任务执行历史")
 
     def _run_loop(self) -> None:
         """调度循环（后台线程）"""
         logger.info("定时任务调度循环已启动")
 
         while not self._stop_flag.is_set():
-            try:
-                schedule.run_pending()
-                time.sleep(1)
-            except Exception as e:
-                logger.error(f"调度循环出错: {e}")
+            # 先清除唤醒标志，之后的新增任务 / 停止都会让本轮休眠立即返回
+            self._wakeup.clear()
+
+            for task in self._pop_due(time.monotonic()):
+                try:
+                    task()
+                except Exception as e:
+                    logger.error(f"调度循环出错: {e}")
+
+            # 休眠到堆顶任务到期（最长 _MAX_IDLE_WAIT）
+            with self._task_lock:
+                idle = self._heap[0][0] - time.monotonic() if self._heap else _MAX_IDLE_WAIT
+            self._wakeup.wait(min(max(idle, 0.0), _MAX_IDLE_WAIT))
 
         logger.info("定时任务调度循环已停止")
 
+    def _pop_due(self, now: float) -> list[Callable[[], None]]:
+        """弹出所有到期任务，并按间隔重新入堆"""
+        due: list[Callable[[], None]] = []
+        heap = self._heap
+
+        with self._task_lock:
+            while heap and heap[0][0] <= now:
+                _, seq, task_id = heapq.heappop(heap)
+
+                # 已移除（或移除后同名重新添加）的任务，丢弃旧条目
+                task = self._tasks.get(task_id)
+                if task is None or task[2] != seq:
+                    continue
+
+                interval_s, func, _ = task
+                due.append(func)
+                heapq.heappush(heap, (now + interval_s, seq, task_id))
+
+        return due
+
     def _execute_task(
         self,
         task_id: str,
         task_name: str,
         task_func: Callable,
-        **kwargs: Any,
+        kwargs: dict[str, Any],
     ) -> None:
         """执行任务并记录历史"""
         start_time = datetime.now()
@@ -445,13 +473,8 @@ class TaskScheduler:
             self._add_history(record)
 
     def _add_history(self, record: TaskRecord) -> None:
-        """添加执行历史"""
-        with self._lock:
-            self._history.append(record)
-
-            # 限制历史记录数量
-            if len(self._history) > self._max_history:
-                self._history = self._history[-self._max_history:]
+        """添加执行历史（deque 满时自动淘汰最旧记录）"""
+        self._history.append(record)
 
 
 # 全局调度器实例
@@ -8,17 +8,18 @@
 Author: 海山观澜
 """
 
-import threading
+import asyncio
+import re
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
-
-import requests
+from typing import Any, TYPE_CHECKING
 
 from guanlan.core.setting.contract import save_contracts
 from guanlan.core.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = get_logger(__name__)
 
 # 新浪行情接口请求头
@@ -34,87 +35,121 @@ _HEADERS: dict[str, str] = {
 # 持仓量在行情字符串中的索引
 _POSITION_INDEX: int = 13
 
+# 行情行：var hq_str_nf_RB0="字段1,字段2,...";
+_LINE_RE = re.compile(r'hq_str_nf_([A-Za-z0-9]+)="([^"]*)"')
+
+
+def _month_suffixes(now: datetime | None = None) -> list[str]:
+    """未来24个月的合约月份后缀（YYMM），如 ["2605", "2606", ...]"""
+    now = now or datetime.now()
+    suffixes: list[str] = []
+    for offset in range(24):
+        y, m = divmod(now.month + offset - 1, 12)
+        suffixes.append(f"{(now.year + y) % 100:02d}{m + 1:02d}")
+    return suffixes
+
+
+def _decode(content: bytes) -> str:
+    """按 GBK 解码行情响应（新浪固定使用 GBK，跳过响应编码探测）"""
+    return content.decode("gbk", errors="replace")
+
+
+def _build_url(code: str, month_suffixes: list[str]) -> str:
+    """构造查询地址：连续合约 + 未来24个月的月份合约"""
+    query = ",".join([f"nf_{code}0", *[f"nf_{code}{suffix}" for suffix in month_suffixes]])
+    return f"https://hq.sinajs.cn/list={query}"
 
-def fetch_main_contract(
+
+def _apply_main_contract(
     code: str,
-    contracts: dict[str, dict[str, Any]]
+    text: str,
+    contracts: dict[str, dict[str, Any]],
 ) -> bool:
-    """从新浪行情接口获取单个品种的主力合约
+    """解析行情文本，持仓量与连续合约一致的月份合约即为主力
 
-    通过连续合约(code+"0")的持仓量，在所有月份合约中匹配主力。
+    连续合约在查询列表首位，通常最先返回；之后的月份合约逐个比较，
+    命中即返回，不再解析剩余行。
+    """
+    continuous = f"{code}0"
+    target_position: str | None = None
+    # 连续合约之前出现的月份合约（正常情况下为空）
+    pending: list[tuple[str, str]] = []
+
+    for match in _LINE_RE.finditer(text):
+        symbol, val = match.groups()
+
+        # 只切到持仓量字段为止（空行情切分后长度不足，一并跳过）
+        fields = val.split(",", _POSITION_INDEX + 1)
+        if len(fields) <= _POSITION_INDEX:
+            continue
+
+        position = fields[_POSITION_INDEX]
+
+        if symbol == continuous:
+            if not position:
+                return False
+            target_position = position
+            for month_symbol, month_position in pending:
+                if month_position == target_position:
+                    contracts[code]["vt_symbol"] = month_symbol
+                    return True
+        elif target_position is None:
+            pending.append((symbol, position))
+        elif position == target_position:
+            contracts[code]["vt_symbol"] = symbol
+            return True
 
-    Parameters
-    ----------
-    code : str
-        品种代码（如 "RB"）
-    contracts : dict
-        合约数据字典（会被修改）
+    return False
 
-    Returns
-    -------
-    bool
-        是否获取成功
+
+async def _fetch_main_contract_async(
+    client: "httpx.AsyncClient",
+    code: str,
+    contracts: dict[str, dict[str, Any]],
+    month_suffixes: list[str],
+) -> bool:
+    """获取单个品种的主力合约
+
+    通过连续合约(code+"0")的持仓量，在所有月份合约中匹配主力。
     """
     try:
-        # 构造查询列表：连续合约 + 未来24个月的月份合约
-        now = datetime.now()
-        symbols = [f"{code}0"]
-        for offset in range(24):
-            y = now.year + (now.month + offset - 1) // 12
-            m = (now.month + offset - 1) % 12 + 1
-            symbols.append(f"{code}{str(y)[2:]}{m:02d}")
-
-        query = ",".join(f"nf_{s}" for s in symbols)
-        url = f"https://hq.sinajs.cn/list={query}"
-
-        r = requests.get(url, headers=_HEADERS, timeout=10)
+        r = await client.get(_build_url(code, month_suffixes))
         if r.status_code != 200:
             return False
 
-        # 解析连续合约的持仓量
-        target_position = ""
-        month_contracts: dict[str, str] = {}
-
-        for line in r.text.strip().split(";"):
-            if '="' not in line:
-                continue
-            key_part, _, val = line.partition('="')
-            val = val.rstrip('"')
-            if not val:
-                continue
-
-            fields = val.split(",")
-            if len(fields) <= _POSITION_INDEX:
-                continue
-
-            # 从 var hq_str_nf_RB0 提取 RB0
-            symbol = key_part.rsplit("nf_", 1)[-1]
-            position = fields[_POSITION_INDEX]
-
-            if symbol == f"{code}0":
-                target_position = position
-            else:
-                month_contracts[symbol] = position
-
-        # 找持仓量匹配的月份合约即为主力
-        if target_position:
-            for symbol, position in month_contracts.items():
-                if position == target_position:
-                    contracts[code]["vt_symbol"] = symbol
-                    return True
-
-        return False
+        return _apply_main_contract(code, _decode(r.content), contracts)
 
     except Exception as e:
         logger.warning("获取 %s 主力合约失败: %s", code, e)
         return False
 
 
+async def _refresh_async(
+    contracts: dict[str, dict[str, Any]],
+    month_suffixes: list[str],
+) -> list[bool]:
+    """单线程事件循环并发请求所有品种"""
+    import httpx
+
+    async with httpx.AsyncClient(
+        headers=_HEADERS,
+        timeout=10,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        transport=httpx.AsyncHTTPTransport(retries=2),
+    ) as client:
+        return await asyncio.gather(*[
+            _fetch_main_contract_async(client, code, contracts, month_suffixes)
+            for code in contracts
+        ])
+
+
 def refresh_all(
     contracts: dict[str, dict[str, Any]],
     on_complete: Callable[[int, int], None] | None = None,
 ) -> None:
-    """多线程批量刷新所有品种的主力合约
+    """并发批量刷新所有品种的主力合约
+
+    在调用线程上运行独立的事件循环（调用方为工作线程，不能已有运行中的循环）。
 
     Parameters
     ----------
@@ -125,33 +160,18 @@ def refresh_all(
     """
     logger.info("开始刷新主力合约")
 
-    task_count = len(contracts)
-
-    if task_count == 0:
+    if not contracts:
         if on_complete:
             on_complete(0, 0)
         return
 
-    lock = threading.Lock()
-    total = 0
-    errors = 0
-
-    def _callback(future):
-        nonlocal total, errors
-        with lock:
-            total += 1
-            if not future.result():
-                errors += 1
-            done = total == task_count
-
-        # 全部完成（在锁外执行，避免死锁）
-        if done:
-            save_contracts(contracts)
-            logger.info("主力合约刷新完成: 总数=%d, 失败=%d", total, errors)
-            if on_complete:
-                on_complete(total, errors)
-
-    with ThreadPoolExecutor(max_workers=10) as pool:
-        for code in contracts:
-            future = pool.submit(fetch_main_contract, code, contracts)
-            future.add_done_callback(_callback)
+    # 月份后缀所有品种共用，只计算一次
+    results = asyncio.run(_refresh_async(contracts, _month_suffixes()))
+
+    total = len(results)
+    errors = results.count(False)
+
+    save_contracts(contracts)
+    logger.info("主力合约刷新完成: 总数=%d, 失败=%d", total, errors)
+    if on_complete:
+        on_complete(total, errors)
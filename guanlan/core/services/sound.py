@@ -3,19 +3,17 @@
 观澜量化 - 音频播放服务
 
 使用 pygame.mixer.Sound 实现多通道并行播放，多个音效互不打断。
-Sound 对象按文件路径缓存，避免重复加载。
+下单/成交音效各自占用保留通道，其余音效使用公共通道。
+Sound 对象按文件名缓存，避免重复加载。
+音效序列由后台线程按间隔依次播放，调用方不阻塞。
 
 Author: 海山观澜
 """
 
 from pathlib import Path
-from typing import Literal
-
-try:
-    import pygame
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
+from queue import Queue
+from threading import Thread
+from typing import Any, Literal
 
 from guanlan.core.utils.logger import get_simple_logger
 
@@ -23,6 +21,26 @@ from guanlan.core.utils.logger import get_simple_logger
 logger = get_simple_logger("sound", level=20)
 
 
+# pygame 延迟到首次创建播放器时导入（导入 + 初始化耗时数百毫秒）
+pygame: Any = None
+
+
+def _import_pygame() -> bool:
+    """导入 pygame，返回是否可用"""
+    global pygame
+    if pygame is None:
+        try:
+            import pygame as _pygame
+        except ImportError:
+            return False
+        pygame = _pygame
+    return True
+
+
+# 缓存查询的默认值（区分"未加载"与"已确认文件不存在"的 None）
+_UNCACHED: Any = object()
+
+
 # 预定义音效类型
 SoundType = Literal[
     "buy",        # 买入下单
@@ -42,6 +60,35 @@ SoundType = Literal[
 ]
 
 
+class SoundSequencer:
+    """音效序列播放器
+
+    后台线程从队列取出 (音效, 间隔毫秒) 依次播放，
+    入队后立即返回，不阻塞调用线程。
+    """
+
+    def __init__(self, player: "SoundPlayer") -> None:
+        self._player = player
+        self._queue: Queue[tuple[str, int]] = Queue()
+
+        # 创建时即启动后台线程（空闲时阻塞在队列上），多线程同时入队不会重复启动
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, sequence: list[tuple[SoundType, int]]) -> None:
+        """追加音效序列"""
+        for item in sequence:
+            self._queue.put(item)
+
+    def _run(self) -> None:
+        """后台播放循环"""
+        while True:
+            sound_type, delay_ms = self._queue.get()
+            self._player.play(sound_type)
+            if delay_ms > 0:
+                pygame.time.wait(delay_ms)
+
+
 class SoundPlayer:
     """音频播放器（单例模式）
 
@@ -51,6 +98,7 @@ class SoundPlayer:
     --------
     >>> player = SoundPlayer.get_instance()
     >>> player.play("buy")
+    >>> player.play_sequence([("buy", 500), ("con_buy", 0)])
     >>> player.set_volume(0.5)
     """
 
@@ -66,20 +114,23 @@ class SoundPlayer:
         if self._initialized:
             return
 
-        if not PYGAME_AVAILABLE:
+        if not _import_pygame():
             logger.warning("pygame 库未安装，音频播放功能不可用")
             self._available = False
             self._initialized = True
             return
 
         try:
-            pygame.mixer.init()
+            from guanlan.core.constants import RESOURCES_SOUNDS_DIR
+
+            self._init_mixer()
+            self._channels = self._reserve_channels()
             self._available = True
             self._volume = 1.0
-            self._cache: dict[str, "pygame.mixer.Sound"] = {}
-
-            from guanlan.core.constants import RESOURCES_SOUNDS_DIR
+            # 文件名 → Sound（None 表示文件不存在或无法加载，不再重试）
+            self._cache: dict[str, "pygame.mixer.Sound | None"] = {}
             self._sound_dir = RESOURCES_SOUNDS_DIR
+            self._sequencer = SoundSequencer(self)
 
             logger.info(f"音频播放器初始化成功，音频目录: {self._sound_dir}")
 
@@ -89,6 +140,53 @@ class SoundPlayer:
 
         self._initialized = True
 
+    @staticmethod
+    def _init_mixer() -> None:
+        """初始化混音器（小缓冲区降低播放延迟）
+
+        默认缓冲区在部分系统上为 4096 采样（约 90ms），
+        成交提示音明显滞后，因此在 init 前通过 pre_init 缩小缓冲区。
+        低性能设备初始化失败时回退到较大缓冲区。
+        """
+        from guanlan.core.constants import (
+            SOUND_FREQUENCY,
+            SOUND_BUFFER_SAMPLES,
+            SOUND_BUFFER_SAMPLES_FALLBACK,
+        )
+
+        try:
+            pygame.mixer.pre_init(SOUND_FREQUENCY, -16, 2, SOUND_BUFFER_SAMPLES)
+            pygame.mixer.init()
+        except pygame.error as e:
+            logger.warning(
+                f"混音器缓冲区 {SOUND_BUFFER_SAMPLES} 初始化失败: {e}，"
+                f"回退到 {SOUND_BUFFER_SAMPLES_FALLBACK}"
+            )
+            pygame.mixer.quit()
+            pygame.mixer.pre_init(
+                SOUND_FREQUENCY, -16, 2, SOUND_BUFFER_SAMPLES_FALLBACK
+            )
+            pygame.mixer.init()
+
+    @staticmethod
+    def _reserve_channels() -> dict[str, "pygame.mixer.Channel"]:
+        """为交易音效分配保留通道
+
+        保留通道不会被 find_channel 分配给其他音效，
+        成交提示不必等待报警等长音效结束。
+        """
+        from guanlan.core.constants import (
+            SOUND_NUM_CHANNELS,
+            SOUND_RESERVED_CHANNELS,
+        )
+
+        pygame.mixer.set_num_channels(SOUND_NUM_CHANNELS)
+        pygame.mixer.set_reserved(len(SOUND_RESERVED_CHANNELS))
+        return {
+            name: pygame.mixer.Channel(i)
+            for i, name in enumerate(SOUND_RESERVED_CHANNELS)
+        }
+
     @classmethod
     def get_instance(cls) -> "SoundPlayer":
         """获取播放器实例"""
@@ -99,10 +197,16 @@ class SoundPlayer:
         return self._available
 
     def set_volume(self, volume: float) -> None:
-        """设置音量（0.0 - 1.0），对后续播放生效"""
+        """设置音量（0.0 - 1.0）
+
+        音量作用在各混音通道增益上（仅写入浮点值），
+        播放时不再逐个设置 Sound 音量。
+        """
         if not self._available:
             return
         self._volume = max(0.0, min(1.0, volume))
+        for i in range(pygame.mixer.get_num_channels()):
+            pygame.mixer.Channel(i).set_volume(self._volume)
 
     def get_volume(self) -> float:
         """获取当前音量"""
@@ -112,28 +216,52 @@ class SoundPlayer:
         """播放预定义音效"""
         if not self._available:
             return
-        self.play_file(f"{sound_type}.wav")
+        self.play_file(f"{sound_type}.wav", self._channels.get(sound_type))
+
+    def play_sequence(self, sequence: list[tuple[SoundType, int]]) -> None:
+        """按顺序播放音效序列（立即返回）
 
-    def play_file(self, filename: str) -> None:
-        """播放指定音频文件（多通道，互不打断）"""
+        Parameters
+        ----------
+        sequence : list[tuple[SoundType, int]]
+            (音效类型, 播放后间隔毫秒) 列表
+        """
+        if not self._available:
+            return
+        self._sequencer.put(sequence)
+
+    def play_file(
+        self,
+        filename: str,
+        channel: "pygame.mixer.Channel | None" = None,
+    ) -> None:
+        """播放指定音频文件（多通道，互不打断）
+
+        未指定通道时从公共通道中选取空闲通道，
+        全部占用则抢占最早开始播放的通道。
+        """
         if not self._available:
             return
 
         try:
-            file_path = self._sound_dir / filename
-            key = str(file_path)
-
-            sound = self._cache.get(key)
+            sound = self._cache.get(filename, _UNCACHED)
             if sound is None:
-                if not file_path.exists():
-                    logger.warning(f"音频文件不存在: {file_path}")
+                return
+
+            if sound is _UNCACHED:
+                # 直接加载，由 SDL 打开失败判断文件不存在（省去单独的 stat）
+                file_path = self._sound_dir / filename
+                try:
+                    sound = pygame.mixer.Sound(str(file_path))
+                except (FileNotFoundError, pygame.error) as e:
+                    self._cache[filename] = None
+                    logger.warning(f"音频文件不存在或无法加载: {file_path} ({e})")
                     return
-                sound = pygame.mixer.Sound(str(file_path))
-                self._cache[key] = sound
-
-            sound.set_volume(self._volume)
+                self._cache[filename] = sound
 
-            sound.play()
+            if channel is None:
+                channel = pygame.mixer.find_channel(True)
+            channel.play(sound)
 
         except Exception as e:
             logger.error(f"播放音频失败: {e}")
@@ -181,10 +309,17 @@ def play_file(filename: str) -> None:
     get_player().play_file(filename)
 
 
+def play_sequence(sequence: list[tuple[SoundType, int]]) -> None:
+    """按顺序播放音效序列（立即返回）"""
+    get_player().play_sequence(sequence)
+
+
 __all__ = [
     "SoundType",
     "SoundPlayer",
+    "SoundSequencer",
     "get_player",
     "play",
     "play_file",
+    "play_sequence",
 ]
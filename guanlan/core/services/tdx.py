@@ -4,15 +4,18 @@
 
 直接读取通达信安装目录下的二进制 K 线文件（.lc1 / .lc5 / .day），
 自动发现合约并转换为 BarData 供导入 ArcticDB。
+记录为固定 32 字节结构体，内存映射后按 NumPy 结构化数组整体读取。
 
 Author: 海山观澜
 """
 
-import struct
+import mmap
+import os
+import re
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 from vnpy.trader.object import BarData
 
 from guanlan.core.constants import Exchange, Interval
@@ -38,6 +41,98 @@ DIR_INTERVAL_MAP: dict[str, tuple[Interval, str]] = {
     "lday": (Interval.DAILY, ".day"),
 }
 
+# 文件名主干：市场编号#合约代码，合约代码以 L8(主力连续) / L9(指数) 结尾为特殊合约
+# 合约代码仅限字母数字（跳过 L-F2605、PP-F2605 等通达信仿真合约）
+_STEM_RE = re.compile(r"(\d+)#(([A-Za-z0-9]+?)(L[89])?)")
+
+# 特殊合约后缀 → 转换用的合约月份
+_CONTINUOUS_SUFFIX: dict[str, str] = {"L8": "8888", "L9": "9999"}
+
+# 分钟线记录（.lc1 / .lc5，32 字节）：<HHfffffii>
+# date = (年-2004)*2048 + 月*100 + 日，time = 当日分钟数，amount 为按 float 存放的 uint32 持仓量
+_LC_DTYPE = np.dtype([
+    ("date", "<u2"),
+    ("time", "<u2"),
+    ("open", "<f4"),
+    ("high", "<f4"),
+    ("low", "<f4"),
+    ("close", "<f4"),
+    ("amount", "<f4"),
+    ("volume", "<i4"),
+    ("reserved", "<i4"),
+])
+
+# 扩展行情日线记录（.day，32 字节）：<IffffIIf>
+# date = YYYYMMDD，amount 为 uint32 持仓量，settle 为结算价
+_DAY_DTYPE = np.dtype([
+    ("date", "<u4"),
+    ("open", "<f4"),
+    ("high", "<f4"),
+    ("low", "<f4"),
+    ("close", "<f4"),
+    ("amount", "<u4"),
+    ("volume", "<u4"),
+    ("settle", "<f4"),
+])
+
+# K 线价格 / 成交量列（按 BarData 字段顺序）
+_PRICE_COLUMNS: tuple[str, ...] = ("open", "high", "low", "close", "volume")
+
+
+def _read_records(filepath: str, dtype: np.dtype) -> np.ndarray:
+    """内存映射读取定长记录，返回只读结构化数组（零拷贝，由页缓存直接提供数据）
+
+    数组持有映射的引用，数组释放后映射随之关闭；文件末尾不足一条的残余字节忽略。
+    """
+    with open(filepath, "rb") as f:
+        count = os.fstat(f.fileno()).st_size // dtype.itemsize
+        if not count:
+            return np.empty(0, dtype=dtype)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return np.frombuffer(mm, dtype=dtype, count=count)
+
+
+def _to_datetime64(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    """年 / 月 / 日整数列 → datetime64[D] 列"""
+    months = (year - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (month - 1)
+    return months.astype("datetime64[D]") + (day - 1)
+
+
+def _build_bars(
+    file_info: "TdxFileInfo",
+    records: np.ndarray,
+    dts: np.ndarray,
+    open_interests: np.ndarray,
+) -> list[BarData]:
+    """按列组装 BarData 列表（价格 / 成交量取自结构化记录）"""
+    # 提取交易所格式的 symbol（不含交易所后缀）
+    symbol = file_info.vt_symbol.split(".")[0]
+    exchange = file_info.exchange
+    interval = file_info.interval
+
+    return [
+        BarData(
+            symbol=symbol,
+            exchange=exchange,
+            interval=interval,
+            datetime=dt,
+            open_price=open_price,
+            high_price=high_price,
+            low_price=low_price,
+            close_price=close_price,
+            volume=volume,
+            turnover=0.0,
+            open_interest=open_interest,
+            gateway_name="TDX",
+        )
+        for dt, open_price, high_price, low_price, close_price, volume, open_interest in zip(
+            dts.astype("datetime64[us]").tolist(),
+            *[records[col].astype(np.float64).tolist() for col in _PRICE_COLUMNS],
+            open_interests.astype(np.float64).tolist(),
+        )
+    ]
+
 
 @dataclass
 class TdxFileInfo:
@@ -88,15 +183,20 @@ class TdxService:
             if not dir_path.exists():
                 continue
 
-            for file_path in dir_path.iterdir():
-                if not file_path.suffix.lower() in (ext, ext.upper()):
-                    continue
-
-                info = TdxService._parse_file(
-                    file_path, interval, dir_name, contracts
-                )
-                if info:
-                    results.append(info)
+            # scandir 直接给出文件名字符串（Windows 下 stat 信息随目录项一并返回），
+            # 避免逐个构造 Path 对象
+            ext_len = len(ext)
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name[-ext_len:].lower() != ext:
+                        continue
+
+                    info = TdxService._parse_file(
+                        entry, name[:-ext_len], interval, dir_name, contracts
+                    )
+                    if info:
+                        results.append(info)
 
         # 按 vt_symbol 排序
         results.sort(key=lambda x: x.vt_symbol)
@@ -104,33 +204,23 @@ class TdxService:
 
     @staticmethod
     def _parse_file(
-        file_path: Path,
+        entry: os.DirEntry,
+        stem: str,
         interval: Interval,
         dir_type: str,
         contracts: dict,
     ) -> TdxFileInfo | None:
         """解析单个文件名，提取合约信息
 
-        文件名格式: 28#OI2605.lc1
+        文件名格式: 28#OI2605.lc1（stem 为去掉扩展名的 28#OI2605）
         """
-        stem = file_path.stem  # 28#OI2605
-        if "#" not in stem:
+        # 一次匹配拆出市场编号、合约代码及特殊合约后缀（28#OI2605 / 28#OIL8）
+        match = _STEM_RE.fullmatch(stem)
+        if not match:
             return None
 
-        parts = stem.split("#", 1)
-        if len(parts) != 2:
-            return None
-
-        try:
-            market_code = int(parts[0])
-        except ValueError:
-            return None
-
-        raw_symbol = parts[1]  # OI2605
-
-        # 跳过含特殊字符的非标准合约（如通达信仿真合约 L-F2605、PP-F2605）
-        if not raw_symbol.isalnum():
-            return None
+        market_code_str, raw_symbol, body, suffix = match.groups()
+        market_code = int(market_code_str)
 
         # 市场编号映射
         exchange = MARKET_EXCHANGE_MAP.get(market_code)
@@ -138,14 +228,8 @@ class TdxService:
             return None
 
         # 特殊合约处理：L8=主力连续, L9=指数
-        symbol_for_convert = raw_symbol
-        is_continuous = False
-        if raw_symbol.endswith("L8"):
-            symbol_for_convert = raw_symbol[:-2] + "8888"
-            is_continuous = True
-        elif raw_symbol.endswith("L9"):
-            symbol_for_convert = raw_symbol[:-2] + "9999"
-            is_continuous = True
+        is_continuous = suffix is not None
+        symbol_for_convert = f"{body}{_CONTINUOUS_SUFFIX[suffix]}" if is_continuous else raw_symbol
 
         # 提取品种代码，查找合约信息
         commodity = SymbolConverter.extract_commodity(symbol_for_convert)
@@ -158,16 +242,13 @@ class TdxService:
         # 转为交易所格式
         ex_symbol = SymbolConverter.to_exchange(symbol_for_convert, exchange)
 
-        # 推算数据条数（按文件大小和记录结构体大小）
-        file_size = file_path.stat().st_size
-        if dir_type == "lday":
-            record_size = 32  # <IffffIIf> = 4+4*4+4+4+4 = 32
-        else:
-            record_size = 32  # <HHfffffII> = 2+2+4*5+4+4 = 32
-        bar_count = file_size // record_size if record_size > 0 else 0
+        # 推算数据条数（按文件大小和记录结构体大小，只对识别出的合约取 stat）
+        file_size = entry.stat().st_size
+        record_size = (_DAY_DTYPE if dir_type == "lday" else _LC_DTYPE).itemsize
+        bar_count = file_size // record_size
 
         return TdxFileInfo(
-            filepath=str(file_path),
+            filepath=entry.path,
             market_code=market_code,
             raw_symbol=raw_symbol,
             vt_symbol=f"{ex_symbol}.{exchange.value}",
@@ -200,92 +281,41 @@ class TdxService:
 
     @staticmethod
     def _read_minute_bars(file_info: TdxFileInfo) -> list[BarData]:
-        """读取分钟线数据（.lc1 / .lc5）"""
-        from pytdx.reader import TdxLCMinBarReader
-
-        reader = TdxLCMinBarReader()
-        df = reader.get_df(file_info.filepath)
+        """读取分钟线数据（.lc1 / .lc5）
 
-        if df.empty:
+        按固定 32 字节记录整体映射为结构化数组，各字段为连续列，无需逐条解析。
+        """
+        records = _read_records(file_info.filepath, _LC_DTYPE)
+        if not records.size:
             return []
 
-        # 提取交易所格式的 symbol（不含交易所后缀）
-        symbol = file_info.vt_symbol.split(".")[0]
-        exchange = file_info.exchange
-        interval = file_info.interval
-
-        bars: list[BarData] = []
-        for _, row in df.iterrows():
-            dt = row.name.to_pydatetime()
-
-            # 通达信分钟线时间处理：
-            # 09:31 表示 09:30~09:31 这一分钟，需要减1分钟对齐
-            dt = dt - timedelta(minutes=1)
-
-            # 夜盘时间修正（>15:00 的归到前一天）
-            if dt.hour > 15:
-                dt = dt - timedelta(days=1)
-
-            # 持仓量修正：amount 字段实际是 uint32 持仓量按 float 读取
-            amount_float = row["amount"]
-            open_interest = struct.unpack(
-                "<I", struct.pack("<f", amount_float)
-            )[0]
-
-            bar = BarData(
-                symbol=symbol,
-                exchange=exchange,
-                interval=interval,
-                datetime=dt,
-                open_price=float(row["open"]),
-                high_price=float(row["high"]),
-                low_price=float(row["low"]),
-                close_price=float(row["close"]),
-                volume=float(row["volume"]),
-                turnover=0.0,
-                open_interest=float(open_interest),
-                gateway_name="TDX",
-            )
-            bars.append(bar)
-
-        return bars
+        date = records["date"].astype(np.int64)
+        dts = (
+            _to_datetime64(date // 2048 + 2004, date % 2048 // 100, date % 2048 % 100)
+            .astype("datetime64[m]")
+            + records["time"].astype("timedelta64[m]")
+        )
+
+        # 通达信分钟线时间处理：
+        # 09:31 表示 09:30~09:31 这一分钟，需要减1分钟对齐
+        dts -= np.timedelta64(1, "m")
+
+        # 夜盘时间修正（>15:00 的归到前一天）
+        hours = (dts.astype("datetime64[h]") - dts.astype("datetime64[D]")).astype(np.int64)
+        dts = np.where(hours > 15, dts - np.timedelta64(1, "D"), dts)
+
+        # 持仓量修正：amount 字段实际是 uint32 持仓量按 float 存放，整列按位重新解释
+        return _build_bars(file_info, records, dts, records["amount"].view(np.uint32))
 
     @staticmethod
     def _read_daily_bars(file_info: TdxFileInfo) -> list[BarData]:
         """读取日线数据（.day）"""
-        from pytdx.reader import TdxExHqDailyBarReader
-
-        reader = TdxExHqDailyBarReader()
-        df = reader.get_df(file_info.filepath)
-
-        if df.empty:
+        records = _read_records(file_info.filepath, _DAY_DTYPE)
+        if not records.size:
             return []
 
-        symbol = file_info.vt_symbol.split(".")[0]
-        exchange = file_info.exchange
-        interval = file_info.interval
-
-        bars: list[BarData] = []
-        for _, row in df.iterrows():
-            dt = row.name.to_pydatetime()
-
-            # 日线的 amount 字段已经是 uint32，可直接用作持仓量
-            open_interest = float(row["amount"])
-
-            bar = BarData(
-                symbol=symbol,
-                exchange=exchange,
-                interval=interval,
-                datetime=dt,
-                open_price=float(row["open"]),
-                high_price=float(row["high"]),
-                low_price=float(row["low"]),
-                close_price=float(row["close"]),
-                volume=float(row["volume"]),
-                turnover=0.0,
-                open_interest=open_interest,
-                gateway_name="TDX",
-            )
-            bars.append(bar)
-
-        return bars
+        date = records["date"].astype(np.int64)
+        dts = _to_datetime64(date // 10000, date // 100 % 100, date % 100)
+
+        # 日线的 amount 字段已经是 uint32，可直接用作持仓量
+        return _build_bars(file_info, records, dts, records["amount"])
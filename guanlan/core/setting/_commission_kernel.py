@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+观澜量化 - 手续费批量计算内核
+
+对逐笔成交的价格、数量、费率数组整体计算手续费。
+安装了 numba 时费率运算编译为本地代码，否则直接以 NumPy 向量化运算执行。
+
+Author: 海山观澜
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# 放大到分后距离 .5 小于该值的视为临界值，改用 round() 精确舍入
+_TIE_TOLERANCE: float = 1e-6
+
+
+def _raw_commissions(
+    prices: np.ndarray,
+    volumes: np.ndarray,
+    sizes: np.ndarray,
+    ratios: np.ndarray,
+    fixed: np.ndarray,
+) -> np.ndarray:
+    """按成交所在档位的费率计算手续费（比例费率优先，否则用固定费率），未舍入"""
+    return np.where(
+        ratios != 0,
+        ratios * prices * volumes * 0.0001 * sizes,
+        fixed * volumes,
+    )
+
+
+# 不开启 fastmath，保证与逐笔计算的运算顺序一致
+if njit is not None:
+    _raw_commissions = njit(cache=True)(_raw_commissions)
+
+
+def _round_cents(values: np.ndarray) -> np.ndarray:
+    """保留两位小数，结果与逐个 round(value, 2) 一致
+
+    np.round 先放大 100 倍再舍入，放大时的误差会让恰在半分附近的值舍入方向与
+    round() 不同；这类临界值极少，单独用 round() 重算。
+    """
+    scaled = values * 100
+    result = np.round(scaled) / 100
+
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_TOLERANCE)
+    for i in ties.tolist():
+        result[i] = round(float(values[i]), 2)
+
+    return result
+
+
+def compute_commissions(
+    prices: np.ndarray,
+    volumes: np.ndarray,
+    sizes: np.ndarray,
+    ratios: np.ndarray,
+    fixed: np.ndarray,
+) -> np.ndarray:
+    """批量计算手续费（各参数为等长 float64 数组，返回保留两位小数的手续费数组）"""
+    return _round_cents(_raw_commissions(prices, volumes, sizes, ratios, fixed))
@@ -26,6 +26,9 @@ ACCOUNT_FIELDS: list[tuple[str, str]] = [
     ("柜台环境", "实盘"),
 ]
 
+# 空账户模板（值均为字符串，浅复制即可得到独立副本）
+_ACCOUNT_TEMPLATE: dict[str, str] = dict(ACCOUNT_FIELDS)
+
 # 密码字段（需要掩码显示）
 PASSWORD_FIELDS: set[str] = {"密码", "授权编码"}
 
@@ -59,7 +62,7 @@ def get_default_env(config: dict[str, Any]) -> str:
 
 def new_account() -> dict[str, str]:
     """创建空账户模板"""
-    return {field: default for field, default in ACCOUNT_FIELDS}
+    return _ACCOUNT_TEMPLATE.copy()
 
 
 def is_auto_login(account_data: dict[str, str]) -> bool:
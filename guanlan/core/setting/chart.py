@@ -3,6 +3,7 @@
 观澜量化 - 图表配置管理
 
 管理品种的周期和指标参数持久化。
+文件未修改时 load_json_file 复用缓存的解析结果，读写前无需重新解析。
 
 Author: 海山观澜
 """
@@ -3,6 +3,7 @@
 观澜量化 - 图表方案管理
 
 管理图表方案（合约 + 周期 + 指标配置）的持久化。
+文件未修改时 load_json_file 复用缓存的解析结果，读写前无需重新解析。
 
 Author: 海山观澜
 """
@@ -20,6 +21,11 @@ def load_schemes() -> dict[str, dict[str, Any]]:
     return load_json_file(CHART_SCHEMES_FILE)
 
 
+def has_scheme(name: str) -> bool:
+    """方案是否已存在"""
+    return name in load_schemes()
+
+
 def save_scheme(name: str, data: dict[str, Any]) -> None:
     """保存方案"""
     schemes = load_schemes()
@@ -30,8 +36,8 @@ def save_scheme(name: str, data: dict[str, Any]) -> None:
 def delete_scheme(name: str) -> None:
     """删除方案"""
     schemes = load_schemes()
-    schemes.pop(name, None)
-    save_json_file(CHART_SCHEMES_FILE, schemes)
+    if schemes.pop(name, None) is not None:
+        save_json_file(CHART_SCHEMES_FILE, schemes)
 
 
 def rename_scheme(old_name: str, new_name: str) -> None:
@@ -7,12 +7,85 @@
 Author: 海山观澜
 """
 
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
 from vnpy.trader.constant import Offset
 from vnpy.trader.object import TradeData
 
+from guanlan.core.setting._commission_kernel import compute_commissions
 from guanlan.core.utils.symbol_converter import SymbolConverter
 
 
+# 手续费率：(合约乘数, 开仓档, 平今档, 平昨档)，每档为 (比例费率, 固定费率)
+CommissionRates = tuple[float, tuple[float, float], tuple[float, float], tuple[float, float]]
+
+# 开平方向 → 费率档位（其他方向按平昨）
+_OFFSET_TIER: dict[Offset, int] = {
+    Offset.OPEN: 1,
+    Offset.CLOSETODAY: 2,
+}
+
+# 未配置手续费的品种按零费率计算
+_NO_RATES: CommissionRates = (1, (0, 0), (0, 0), (0, 0))
+
+# 合约代码 → 品种代码（合约数量有限，缓存后免去逐笔正则匹配）
+_COMMODITY_CACHE: dict[str, str] = {}
+
+
+# 指定的品种手续费配置（优化子进程等无 AppEngine 的场景），None 时使用 AppEngine 缓存
+_contracts: dict[str, dict[str, Any]] | None = None
+
+
+def use_contracts(contracts: dict[str, dict[str, Any]]) -> None:
+    """指定手续费配置，替代 AppEngine 缓存（供参数优化子进程使用）"""
+    global _contracts
+    _contracts = contracts
+
+
+def _get_contracts() -> dict[str, dict[str, Any]]:
+    """品种手续费配置（默认取 AppEngine 缓存）"""
+    if _contracts is not None:
+        return _contracts
+
+    from guanlan.core.app import AppEngine
+    return AppEngine.instance().contracts
+
+
+def _resolve_rates(symbol: str, contracts: dict[str, dict[str, Any]]) -> CommissionRates | None:
+    """解析合约的手续费率（品种未配置时返回 None）"""
+    commodity = _COMMODITY_CACHE.get(symbol)
+    if commodity is None:
+        commodity = _COMMODITY_CACHE[symbol] = SymbolConverter.extract_commodity(symbol)
+    if not commodity:
+        return None
+
+    config = contracts.get(commodity)
+    if not config:
+        return None
+
+    return (
+        config.get("size", 1),
+        (config.get("open_ratio", 0), config.get("open", 0)),
+        (config.get("close_today_ratio", 0), config.get("close_today", 0)),
+        (config.get("close_ratio", 0), config.get("close", 0)),
+    )
+
+
+def _apply_rates(rates: CommissionRates, trade: TradeData) -> float:
+    """按费率计算单笔成交手续费（比例费率优先，否则用固定费率）"""
+    size = rates[0]
+    ratio, fixed = rates[_OFFSET_TIER.get(trade.offset, 3)]
+
+    if ratio != 0:
+        result = ratio * trade.price * trade.volume * 0.0001 * size
+    else:
+        result = fixed * trade.volume
+
+    return round(result, 2)
+
+
 def calculate_commission(trade: TradeData) -> float:
     """根据成交信息计算手续费
 
@@ -21,36 +94,37 @@ def calculate_commission(trade: TradeData) -> float:
     - 按 offset 分三档：开仓 / 平今 / 平昨(其他)
     - 比例费率优先，否则用固定费率
     """
-    commodity: str = SymbolConverter.extract_commodity(trade.symbol)
-    if not commodity:
+    rates = _resolve_rates(trade.symbol, _get_contracts())
+    if rates is None:
         return 0.0
+    return _apply_rates(rates, trade)
 
-    from guanlan.core.app import AppEngine
-    config = AppEngine.instance().contracts.get(commodity)
-    if not config:
-        return 0.0
 
-    size: float = config.get("size", 1)
+def calculate_commissions(trades: Iterable[TradeData]) -> np.ndarray:
+    """批量计算手续费（与 calculate_commission 逐笔结果一致）
 
-    if trade.offset == Offset.OPEN:
-        # 开仓
-        if config.get("open_ratio", 0) != 0:
-            result = config["open_ratio"] * trade.price * trade.volume * 0.0001 * size
-        else:
-            result = config.get("open", 0) * trade.volume
+    手续费配置只获取一次，每个合约的费率只解析一次；
+    逐笔展开为价格 / 数量 / 费率数组后交由计算内核整体计算，适合回测等批量场景。
+    """
+    contracts: dict[str, dict[str, Any]] | None = None
+    rates_cache: dict[str, CommissionRates] = {}
 
-    elif trade.offset == Offset.CLOSETODAY:
-        # 平今
-        if config.get("close_today_ratio", 0) != 0:
-            result = config["close_today_ratio"] * trade.price * trade.volume * 0.0001 * size
-        else:
-            result = config.get("close_today", 0) * trade.volume
+    # 每笔成交：(成交价, 成交量, 合约乘数, 比例费率, 固定费率)
+    rows: list[tuple[float, float, float, float, float]] = []
+    for trade in trades:
+        symbol = trade.symbol
+        rates = rates_cache.get(symbol)
+        if rates is None:
+            # 首次遇到成交时才获取配置（无成交时不触发 AppEngine）
+            if contracts is None:
+                contracts = _get_contracts()
+            rates = rates_cache[symbol] = _resolve_rates(symbol, contracts) or _NO_RATES
 
-    else:
-        # 平昨 / 其他
-        if config.get("close_ratio", 0) != 0:
-            result = config["close_ratio"] * trade.price * trade.volume * 0.0001 * size
-        else:
-            result = config.get("close", 0) * trade.volume
+        ratio, fixed = rates[_OFFSET_TIER.get(trade.offset, 3)]
+        rows.append((trade.price, trade.volume, rates[0], ratio, fixed))
 
-    return round(result, 2)
+    if not rows:
+        return np.zeros(0)
+
+    data = np.array(rows, dtype=np.float64)
+    return compute_commissions(data[:, 0], data[:, 1], data[:, 2], data[:, 3], data[:, 4])
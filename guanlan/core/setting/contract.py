@@ -10,7 +10,7 @@ from typing import Any
 from guanlan.core.utils.common import (
     load_json_file, save_json_file,
     load_json_list, save_json_list,
-    to_digit_value
+    save_json_deferred, to_digit_value
 )
 
 # 配置文件路径（相对于 .guanlan 目录）
@@ -62,6 +62,11 @@ def save_contracts(contracts: dict[str, dict[str, Any]]) -> None:
     save_json_file(CONTRACT_FILENAME, contracts)
 
 
+def _save_contracts_later(contracts: dict[str, dict[str, Any]]) -> None:
+    """延迟保存合约数据（连续编辑合并为一次写入）"""
+    save_json_deferred(CONTRACT_FILENAME, contracts)
+
+
 def edit_contract(
     contracts: dict[str, dict[str, Any]],
     symbol: str,
@@ -90,7 +95,7 @@ def edit_contract(
         return False
 
     contracts[symbol][field] = to_digit_value(value)
-    save_contracts(contracts)
+    _save_contracts_later(contracts)
     return True
 
 
@@ -108,7 +113,7 @@ def add_contract(
     if symbol in contracts:
         return False
     contracts[symbol] = data
-    save_contracts(contracts)
+    _save_contracts_later(contracts)
     return True
 
 
@@ -120,7 +125,7 @@ def delete_contract(
     if symbol not in contracts:
         return False
     contracts.pop(symbol)
-    save_contracts(contracts)
+    _save_contracts_later(contracts)
     return True
 
 
@@ -131,7 +136,7 @@ def update_contract(
 ) -> None:
     """更新合约全部字段"""
     contracts[symbol] = data
-    save_contracts(contracts)
+    _save_contracts_later(contracts)
 
 
 def load_favorites() -> list[str]:
@@ -144,18 +149,23 @@ def save_favorites(favorites: list[str]) -> None:
     save_json_list(FAVORITES_FILENAME, favorites)
 
 
+def _save_favorites_later(favorites: list[str]) -> None:
+    """延迟保存收藏列表（连续编辑合并为一次写入）"""
+    save_json_deferred(FAVORITES_FILENAME, favorites)
+
+
 def add_favorite(favorites: list[str], symbol: str) -> None:
     """添加收藏"""
     if symbol not in favorites:
         favorites.append(symbol)
-        save_favorites(favorites)
+        _save_favorites_later(favorites)
 
 
 def remove_favorite(favorites: list[str], symbol: str) -> None:
     """移除收藏"""
     if symbol in favorites:
         favorites.remove(symbol)
-        save_favorites(favorites)
+        _save_favorites_later(favorites)
 
 
 def resolve_symbol(text: str) -> tuple[str, str, str] | None:
@@ -9,6 +9,7 @@ Author: 海山观澜
 
 from datetime import date as Date
 
+import numpy as np
 from vnpy.trader.constant import Direction
 from vnpy.trader.object import TradeData
 
@@ -17,7 +18,7 @@ from vnpy_ctastrategy.backtesting import (
     DailyResult as _DailyResult,
 )
 
-from guanlan.core.setting.commission import calculate_commission
+from guanlan.core.setting.commission import calculate_commissions
 
 
 class DailyResult(_DailyResult):
@@ -25,8 +26,28 @@ class DailyResult(_DailyResult):
 
     重写 calculate_pnl()，将 `turnover * rate` 替换为
     按品种区分开仓/平今/平昨的真实手续费计算。
+
+    成交追加时同步记入成交量、成交价、方向符号三列（SoA），
+    计算盈亏时直接转为连续数组，不再逐笔访问 TradeData 属性。
     """
 
+    # 列缓冲放在 __slots__ 中：不进入实例 __dict__，
+    # 原版按 __dict__ 逐列生成逐日结果表时不会多出这些列
+    __slots__ = ("_volumes", "_prices", "_signs")
+
+    def __init__(self, date: Date, close_price: float) -> None:
+        super().__init__(date, close_price)
+        self._volumes: list[float] = []
+        self._prices: list[float] = []
+        self._signs: list[float] = []
+
+    def add_trade(self, trade: TradeData) -> None:
+        """添加成交，同步追加列缓冲"""
+        super().add_trade(trade)
+        self._volumes.append(trade.volume)
+        self._prices.append(trade.price)
+        self._signs.append(1.0 if trade.direction == Direction.LONG else -1.0)
+
     def calculate_pnl(
         self,
         pre_close: float,
@@ -47,23 +68,31 @@ class DailyResult(_DailyResult):
         self.holding_pnl = self.start_pos * (self.close_price - self.pre_close) * size
 
         # 交易盈亏
-        self.trade_count = len(self.trades)
-
-        for trade in self.trades:
-            if trade.direction == Direction.LONG:
-                pos_change = trade.volume
-            else:
-                pos_change = -trade.volume
-
-            self.end_pos += pos_change
-
-            turnover: float = trade.volume * size * trade.price
-            self.trading_pnl += pos_change * (self.close_price - trade.price) * size
-            self.slippage += trade.volume * size * slippage
-
-            self.turnover += turnover
-            # 真实手续费（替代原版 turnover * rate）
-            self.commission += calculate_commission(trade)
+        trades = self.trades
+        self.trade_count = len(trades)
+
+        if trades:
+            # 成交未经 add_trade 直接写入 trades 时按成交列表重建列缓冲
+            if len(self._volumes) != len(trades):
+                self._volumes = [trade.volume for trade in trades]
+                self._prices = [trade.price for trade in trades]
+                self._signs = [
+                    1.0 if trade.direction == Direction.LONG else -1.0 for trade in trades
+                ]
+
+            # 各项按列向量化汇总
+            volumes = np.asarray(self._volumes, dtype=np.float64)
+            prices = np.asarray(self._prices, dtype=np.float64)
+            signs = np.asarray(self._signs, dtype=np.float64)
+            pos_changes = signs * volumes
+
+            self.end_pos += float(pos_changes.sum())
+            self.trading_pnl += float(np.dot(pos_changes, self.close_price - prices)) * size
+            self.slippage += float(volumes.sum()) * size * slippage
+            self.turnover += float(np.dot(volumes, prices)) * size
+
+            # 真实手续费（替代原版 turnover * rate），按合约批量解析费率
+            self.commission += float(calculate_commissions(trades).sum())
 
         # 净盈亏 = 总盈亏 - 手续费 - 滑点
         self.total_pnl = self.trading_pnl + self.holding_pnl
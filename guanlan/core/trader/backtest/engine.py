@@ -28,6 +28,7 @@ from guanlan.core.trader.cta.template import (
 )
 
 from .backtesting import BacktestingEngine
+from .optimize import run_bf_optimization
 
 APP_NAME = "CtaBacktester"
 
@@ -41,7 +42,9 @@ class BacktesterEngine:
 
     def __init__(self) -> None:
         from guanlan.core.app import AppEngine
-        self.event_engine = AppEngine.instance().event_engine
+        app_engine = AppEngine.instance()
+        self.event_engine = app_engine.event_engine
+        self.contracts: dict = app_engine.contracts
 
         self.classes: dict[str, type] = {}
         self.backtesting_engine: BacktestingEngine | None = None
@@ -297,8 +300,16 @@ class BacktesterEngine:
                 optimization_setting, output=False, max_workers=max_workers,
             )
         else:
-            self.result_values = engine.run_bf_optimization(
-                optimization_setting, output=False, max_workers=max_workers,
+            # 历史数据只在主进程加载一次，随进程池初始化分发给各子进程
+            engine.load_data()
+            if not engine.history_data:
+                self.write_log("参数优化失败，历史数据为空")
+                self.thread = None
+                return
+
+            self.result_values = run_bf_optimization(
+                engine, optimization_setting, self.contracts,
+                max_workers=max_workers, output=self.write_log,
             )
 
         self.thread = None
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+观澜量化 - CTA 参数穷举优化
+
+进程池初始化时每个子进程只加载一次策略类与历史数据，并常驻一个回测引擎；
+之后每组参数只需清空成交记录、重建策略并回放，不再逐组导入策略、读取数据库。
+K 线历史数据按列写入共享内存，子进程直接映射重建，无需逐进程序列化传输。
+
+Author: 海山观澜
+"""
+
+import importlib
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import tzinfo
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.object import BarData
+from vnpy.trader.optimize import OptimizationSetting, check_optimization_setting
+
+from guanlan.core.setting.commission import use_contracts
+
+from .backtesting import BacktestingEngine
+
+
+# 共享内存中的 K 线列：datetime 为当地时间（时区单独传递），价格保持 float64 以免改变回测结果
+_BAR_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("datetime", "datetime64[us]"),
+    ("open_price", "float64"),
+    ("high_price", "float64"),
+    ("low_price", "float64"),
+    ("close_price", "float64"),
+    ("volume", "float64"),
+    ("turnover", "float64"),
+    ("open_interest", "float64"),
+)
+
+# 共享 K 线描述：(共享内存名, K 线数量, 代码, 交易所, 周期, 网关名, 时区)
+SharedBars = tuple[str, int, str, Exchange, Interval | None, str, tzinfo | None]
+
+# 子进程常驻状态：(回测引擎, 策略类, 优化目标)，由 _init_worker 设置
+_worker: tuple[BacktestingEngine, type, str] | None = None
+
+
+def _silent(msg: str) -> None:
+    """子进程不输出回测日志"""
+
+
+def _share_bars(bars: list[BarData]) -> tuple[SharedMemory, SharedBars]:
+    """将 K 线按列写入共享内存（各列依次连续存放），返回共享内存及其描述"""
+    count = len(bars)
+    first = bars[0]
+    shm = SharedMemory(create=True, size=count * 8 * len(_BAR_COLUMNS))
+
+    for i, (name, dtype) in enumerate(_BAR_COLUMNS):
+        column = np.ndarray(count, dtype=dtype, buffer=shm.buf, offset=i * count * 8)
+        if name == "datetime":
+            column[:] = [bar.datetime.replace(tzinfo=None) for bar in bars]
+        else:
+            column[:] = [getattr(bar, name) for bar in bars]
+        del column
+
+    spec: SharedBars = (
+        shm.name,
+        count,
+        first.symbol,
+        first.exchange,
+        first.interval,
+        first.gateway_name,
+        first.datetime.tzinfo,
+    )
+    return shm, spec
+
+
+def _restore_bars(spec: SharedBars) -> list[BarData]:
+    """映射共享内存中的 K 线列，重建 BarData 列表"""
+    name, count, symbol, exchange, interval, gateway_name, tz = spec
+
+    shm = SharedMemory(name=name)
+    try:
+        columns = [
+            np.ndarray(count, dtype=dtype, buffer=shm.buf, offset=i * count * 8).tolist()
+            for i, (_, dtype) in enumerate(_BAR_COLUMNS)
+        ]
+    finally:
+        shm.close()
+
+    return [
+        BarData(
+            symbol=symbol,
+            exchange=exchange,
+            datetime=dt.replace(tzinfo=tz),
+            interval=interval,
+            volume=volume,
+            turnover=turnover,
+            open_interest=open_interest,
+            open_price=open_price,
+            high_price=high_price,
+            low_price=low_price,
+            close_price=close_price,
+            gateway_name=gateway_name,
+        )
+        for dt, open_price, high_price, low_price, close_price, volume, turnover, open_interest
+        in zip(*columns)
+    ]
+
+
+def _init_worker(
+    module_name: str,
+    class_name: str,
+    parameters: dict[str, Any],
+    target_name: str,
+    contracts: dict[str, dict[str, Any]],
+    shared_bars: SharedBars | None,
+    history_data: list,
+) -> None:
+    """进程池初始化：导入策略类，创建回测引擎并装入历史数据"""
+    global _worker
+
+    # 子进程没有 AppEngine，手续费配置由主进程传入
+    use_contracts(contracts)
+
+    # 子进程继承父进程的 sys.path，按模块名导入即得到策略文件的最新内容
+    strategy_class = getattr(importlib.import_module(module_name), class_name)
+
+    engine = BacktestingEngine()
+    engine.output = _silent
+    engine.set_parameters(**parameters)
+    engine.history_data = _restore_bars(shared_bars) if shared_bars else history_data
+
+    _worker = (engine, strategy_class, target_name)
+
+
+def _evaluate(setting: dict) -> tuple:
+    """在常驻引擎上回测一组参数，返回 (参数, 目标值, 统计指标)"""
+    engine, strategy_class, target_name = _worker
+
+    engine.clear_data()
+    engine.add_strategy(strategy_class, setting)
+    engine.run_backtesting()
+    engine.calculate_result()
+    statistics: dict = engine.calculate_statistics(output=False)
+
+    return (setting, statistics.get(target_name, 0), statistics)
+
+
+def run_bf_optimization(
+    engine: BacktestingEngine,
+    optimization_setting: OptimizationSetting,
+    contracts: dict[str, dict[str, Any]],
+    max_workers: int | None = None,
+    output: Callable[[str], None] = print,
+) -> list[tuple]:
+    """穷举优化（engine 需已设置参数、添加策略并加载历史数据）
+
+    Parameters
+    ----------
+    engine : BacktestingEngine
+        主进程回测引擎，提供回测参数、策略类和历史数据
+    optimization_setting : OptimizationSetting
+        优化参数空间与优化目标
+    contracts : dict[str, dict[str, Any]]
+        品种手续费配置（子进程据此计算真实手续费）
+    max_workers : int | None
+        子进程数，None 为 CPU 核数
+    output : Callable[[str], None]
+        日志输出函数
+
+    Returns
+    -------
+    list[tuple]
+        (参数, 目标值, 统计指标) 列表，按目标值从高到低排序
+    """
+    if not check_optimization_setting(optimization_setting, output):
+        return []
+
+    settings: list[dict] = optimization_setting.generate_settings()
+
+    output("开始执行穷举算法优化")
+    output(f"参数优化空间：{len(settings)}")
+
+    start: float = perf_counter()
+
+    parameters: dict[str, Any] = {
+        "vt_symbol": engine.vt_symbol,
+        "interval": engine.interval,
+        "start": engine.start,
+        "end": engine.end,
+        "rate": engine.rate,
+        "slippage": engine.slippage,
+        "size": engine.size,
+        "pricetick": engine.pricetick,
+        "capital": engine.capital,
+        "mode": engine.mode,
+    }
+    strategy_class: type = engine.strategy_class
+
+    # 按批分发参数，减少进程间往返次数
+    workers: int = max_workers or os.cpu_count() or 1
+    chunksize: int = max(len(settings) // (workers * 4), 1)
+
+    # K 线写入共享内存只需一次，Tick 数据仍随初始化参数序列化传递
+    history_data: list = engine.history_data
+    shm: SharedMemory | None = None
+    shared_bars: SharedBars | None = None
+    if history_data and isinstance(history_data[0], BarData):
+        shm, shared_bars = _share_bars(history_data)
+        history_data = []
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                strategy_class.__module__,
+                strategy_class.__name__,
+                parameters,
+                optimization_setting.target_name,
+                contracts,
+                shared_bars,
+                history_data,
+            ),
+        ) as executor:
+            results: list[tuple] = list(executor.map(_evaluate, settings, chunksize=chunksize))
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    results.sort(reverse=True, key=lambda result: result[1])
+
+    cost: int = int(perf_counter() - start)
+    output(f"穷举算法优化完成，耗时{cost}秒")
+
+    return results
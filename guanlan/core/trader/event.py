@@ -7,6 +7,7 @@
 CTP 连接时 ~4000+ 合约事件瞬间涌入，原版 EventEngine 连续处理
 不释放 GIL，导致 UI 线程分不到时间片、界面冻死。
 重载 _run 方法，每处理一批事件就主动释放 GIL。
+新增 put_many 方法，批量事件只加一次队列锁。
 
 Author: 海山观澜
 """
@@ -24,6 +25,20 @@ _YIELD_INTERVAL: int = 64
 class EventEngine(VnpyEventEngine):
     """观澜事件引擎"""
 
+    def put_many(self, events: list[Event]) -> None:
+        """批量放入事件（一次加锁，唤醒处理线程一次）
+
+        队列无容量上限，等价于逐个调用 put，仅减少加锁和通知次数。
+        """
+        if not events:
+            return
+
+        queue = self._queue
+        with queue.mutex:
+            queue.queue.extend(events)
+            queue.unfinished_tasks += len(events)
+            queue.not_empty.notify()
+
     def _run(self) -> None:
         """事件处理循环（带 GIL 释放）"""
         count: int = 0
@@ -5,12 +5,20 @@
 Author: 海山观澜
 """
 
+import atexit
 import json
+import os
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def _get_trader_dir(temp_name: str) -> tuple[Path, Path]:
     """
@@ -234,6 +242,209 @@ def to_digit_value(value: Any, decimals: int = 2) -> int | float | Any:
     return value
 
 
+# JSON 文件解析缓存：路径 → (修改时间 ns, 文件大小, 解析结果)
+# 解析结果只在缓存内部持有，返回给调用方的总是独立副本
+_json_cache: dict[Path, tuple[int, int, Any]] = {}
+
+
+def copy_json(obj: Any) -> Any:
+    """
+    复制 JSON 数据（仅含 dict / list / 标量）
+
+    只递归复制 dict 与 list，标量直接共享，比 copy.deepcopy 快数倍。
+
+    Parameters
+    ----------
+    obj : Any
+        JSON 可序列化的数据
+
+    Returns
+    -------
+    Any
+        与原数据互不影响的副本
+
+    Examples
+    --------
+    >>> data = {"a": [1, 2]}
+    >>> copied = copy_json(data)
+    >>> copied["a"].append(3)
+    >>> data
+    {'a': [1, 2]}
+    """
+    if isinstance(obj, dict):
+        return {key: copy_json(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [copy_json(value) for value in obj]
+    return obj
+
+
+def _json_loads(data: bytes) -> Any:
+    """解析 JSON（优先使用 orjson，遇到 NaN 等 orjson 不接受的旧内容时回退标准库）"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """序列化为 UTF-8 JSON，缩进 2 格，保持键顺序（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _read_json(filepath: Path) -> Any | None:
+    """读取 JSON 文件（文件未修改时复用缓存的解析结果），不存在时返回 None"""
+    # 有尚未落盘的延迟保存时先写入，保证读到最新内容
+    _flush_pending(filepath)
+
+    try:
+        st = filepath.stat()
+    except FileNotFoundError:
+        return None
+
+    cached = _json_cache.get(filepath)
+    if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+        data = _json_loads(filepath.read_bytes())
+        cached = _json_cache[filepath] = (st.st_mtime_ns, st.st_size, data)
+
+    return copy_json(cached[2])
+
+
+def _write_json(filepath: Path, data: Any) -> None:
+    """写入 JSON 文件（2 空格缩进，保留中文），并使该文件的解析缓存失效
+
+    先整体写入同目录临时文件，再原子替换目标文件，中途失败不会留下写了一半的配置。
+    """
+    # 先序列化，数据无法序列化时不触碰任何文件
+    content = _json_dumps(data)
+
+    with _pending_lock:
+        # 直接保存覆盖该文件尚未落盘的延迟保存
+        pending = _pending_writes.pop(filepath, None)
+        if pending is not None:
+            pending[1].cancel()
+
+        _write_bytes(filepath, content)
+
+
+def _write_bytes(filepath: Path, content: bytes) -> None:
+    """原子写入已序列化的内容（临时文件 + os.replace），并使该文件的解析缓存失效"""
+    # 确保父目录存在
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    # 临时文件名区分进程与线程，并发保存同一文件时互不覆盖
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    _json_cache.pop(filepath, None)
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# 延迟保存：路径 → (已序列化的内容, 定时器)，定时器到期或读取该文件时写入
+_pending_writes: dict[Path, tuple[bytes, threading.Timer]] = {}
+_pending_lock = threading.RLock()
+
+# 延迟保存的合并窗口（秒）
+SAVE_DELAY: float = 0.15
+
+# 延迟保存写入失败后的重试间隔（秒）
+SAVE_RETRY_DELAY: float = 5.0
+
+
+def _schedule_write(filepath: Path, content: bytes, delay: float) -> None:
+    """登记延迟写入并（重新）计时，调用方须持有 _pending_lock"""
+    pending = _pending_writes.get(filepath)
+    if pending is not None:
+        pending[1].cancel()
+
+    timer = threading.Timer(delay, _flush_pending, args=(filepath,))
+    timer.daemon = True
+    _pending_writes[filepath] = (content, timer)
+    timer.start()
+
+
+def _flush_pending(filepath: Path) -> None:
+    """写入指定文件尚未落盘的延迟保存（持锁写入，读取方不会读到旧内容）
+
+    写入失败时记录日志并保留数据稍后重试，不向定时器线程或无关的读取方抛出异常。
+    """
+    with _pending_lock:
+        pending = _pending_writes.pop(filepath, None)
+        if pending is None:
+            return
+
+        content, timer = pending
+        timer.cancel()
+        try:
+            _write_bytes(filepath, content)
+        except OSError as e:
+            # logger 模块依赖本模块，延迟导入
+            from guanlan.core.utils.logger import get_logger
+            get_logger("common").error(
+                f"延迟保存失败，{SAVE_RETRY_DELAY:g} 秒后重试: {filepath}, {e}"
+            )
+            _schedule_write(filepath, content, SAVE_RETRY_DELAY)
+
+
+def save_json_deferred(filename: str, data: Any, delay: float = SAVE_DELAY) -> None:
+    """
+    延迟保存 JSON 文件，合并短时间内对同一文件的连续保存
+
+    每次调用立即序列化数据并重新计时，delay 秒内没有新的保存才真正写入一次；
+    读取该文件、直接保存该文件或调用 flush_json_files 时立即写入。
+    写入失败时记录日志并定时重试。
+
+    Parameters
+    ----------
+    filename : str
+        JSON 文件名（位于 .guanlan 目录下）
+    data : Any
+        待保存的数据（调用时即序列化，之后修改原数据不影响本次保存）
+    delay : float, default SAVE_DELAY
+        合并窗口（秒）
+
+    Raises
+    ------
+    TypeError
+        当数据无法 JSON 序列化时（在调用时抛出）
+
+    Examples
+    --------
+    >>> for symbol in symbols:
+    ...     contracts[symbol]["open"] = 3.0
+    ...     save_json_deferred("config/contract.json", contracts)  # 只写入一次
+    """
+    content = _json_dumps(data)
+
+    with _pending_lock:
+        _schedule_write(get_file_path(filename), content, delay)
+
+
+def flush_json_files() -> None:
+    """
+    立即写入所有延迟保存的 JSON 文件（应用退出时自动调用）
+
+    Examples
+    --------
+    >>> flush_json_files()
+    """
+    with _pending_lock:
+        filepaths = list(_pending_writes)
+
+    for filepath in filepaths:
+        _flush_pending(filepath)
+
+
+atexit.register(flush_json_files)
+
+
 def load_json_file(filename: str) -> dict[str, Any]:
     """
     从 JSON 文件加载配置数据（字典类型）
@@ -259,17 +470,14 @@ def load_json_file(filename: str) -> dict[str, Any]:
     - 文件路径为 ~/.guanlan/<filename>
     - 如果文件不存在，会自动创建空的 JSON 文件
     - 如果文件内容无效，会抛出 json.JSONDecodeError
+    - 文件未修改（修改时间与大小不变）时复用上次解析结果，返回独立副本
     """
-    filepath = get_file_path(filename)
-
-    if filepath.exists():
-        with open(filepath, mode="r", encoding="UTF-8") as f:
-            data = json.load(f)
-        return data
-    else:
+    data = _read_json(get_file_path(filename))
+    if data is None:
         # 文件不存在，创建空文件
         save_json_file(filename, {})
         return {}
+    return data
 
 
 def save_json_file(filename: str, data: dict[str, Any]) -> None:
@@ -297,22 +505,12 @@ def save_json_file(filename: str, data: dict[str, Any]) -> None:
     Notes
     -----
     - 文件路径为 ~/.guanlan/<filename>
-    - 自动格式化 JSON（4 空格缩进）
+    - 自动格式化 JSON（2 空格缩进，安装 orjson 时用其序列化）
     - 支持中文字符（ensure_ascii=False）
     - 自动创建父目录
+    - 先写临时文件再原子替换，不会留下写了一半的文件
     """
-    filepath = get_file_path(filename)
-
-    # 确保父目录存在
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(filepath, mode="w", encoding="UTF-8") as f:
-        json.dump(
-            data,
-            f,
-            indent=4,
-            ensure_ascii=False
-        )
+    _write_json(get_file_path(filename), data)
 
 
 def load_json_list(filename: str) -> list[Any]:
@@ -340,17 +538,14 @@ def load_json_list(filename: str) -> list[Any]:
     - 文件路径为 ~/.guanlan/<filename>
     - 如果文件不存在，会自动创建空的 JSON 文件
     - 如果文件内容无效，会抛出 json.JSONDecodeError
+    - 文件未修改（修改时间与大小不变）时复用上次解析结果，返回独立副本
     """
-    filepath = get_file_path(filename)
-
-    if filepath.exists():
-        with open(filepath, mode="r", encoding="UTF-8") as f:
-            data = json.load(f)
-        return data
-    else:
+    data = _read_json(get_file_path(filename))
+    if data is None:
         # 文件不存在，创建空文件
         save_json_list(filename, [])
         return []
+    return data
 
 
 def save_json_list(filename: str, data: list[Any]) -> None:
@@ -378,19 +573,9 @@ def save_json_list(filename: str, data: list[Any]) -> None:
     Notes
     -----
     - 文件路径为 ~/.guanlan/<filename>
-    - 自动格式化 JSON（4 空格缩进）
+    - 自动格式化 JSON（2 空格缩进，安装 orjson 时用其序列化）
     - 支持中文字符（ensure_ascii=False）
     - 自动创建父目录
+    - 先写临时文件再原子替换，不会留下写了一半的文件
     """
-    filepath = get_file_path(filename)
-
-    # 确保父目录存在
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(filepath, mode="w", encoding="UTF-8") as f:
-        json.dump(
-            data,
-            f,
-            indent=4,
-            ensure_ascii=False
-        )
+    _write_json(get_file_path(filename), data)
@@ -56,6 +56,8 @@ class SymbolConverter:
     _PATTERN_STANDARD = re.compile(r'^([A-Z]+)(\d{4})$')     # 统一格式: 大写字母 + 4位数字
     _PATTERN_EXCHANGE_4 = re.compile(r'^([a-zA-Z]+)(\d{4})$')  # 4位年月格式
     _PATTERN_EXCHANGE_3 = re.compile(r'^([A-Z]+)(\d{3})$')    # 3位年月格式(CZCE)
+    _PATTERN_COMMODITY = re.compile(r'[a-zA-Z]+')              # 品种代码(字母前缀)
+    _PATTERN_DATE = re.compile(r'(\d{3,4})$')                  # 年月(末尾3-4位数字)
 
     # 交易所格式配置
     _EXCHANGE_CONFIG = {
@@ -188,11 +190,11 @@ class SymbolConverter:
             'TA'
         """
         # 使用正则提取字母部分
-        match = re.match(r'^([a-zA-Z]+)', symbol)
+        match = SymbolConverter._PATTERN_COMMODITY.match(symbol)
         if not match:
             return ""
 
-        return match.group(1).upper()
+        return match.group().upper()
 
     @staticmethod
     def extract_date(symbol: str, exchange: Exchange | None = None) -> tuple[int, int]:
@@ -215,7 +217,7 @@ class SymbolConverter:
             (24, 12)
         """
         # 提取数字部分
-        match = re.search(r'(\d{3,4})$', symbol)
+        match = SymbolConverter._PATTERN_DATE.search(symbol)
         if not match:
             return (0, 0)
 
@@ -319,13 +319,15 @@ class MainWindow(FluentWindow):
         self._clock_label.setText(f"{now:%Y-%m-%d %H:%M:%S} {weekday}")
 
         from guanlan.core.services.alert import futures
-        futures.check(now.time())
+        futures.check(now.time(), now.date())
 
         # 每个交易日 20:00 自动刷新主力合约 + 下载历史数据
-        key = (now.hour, now.minute)
+        # 先比较时分，其余时刻不取日期、不查日历
+        if (now.hour, now.minute) != self._DAILY_TASK_TIME:
+            return
+
         today = now.date()
-        if (key == self._DAILY_TASK_TIME
-                and getattr(self, "_daily_task_date", None) != today):
+        if getattr(self, "_daily_task_date", None) != today:
             from guanlan.core.services.calendar import is_trading_day
             if is_trading_day(today):
                 self._daily_task_date = today
@@ -198,6 +198,10 @@ class _StreamWorker(QThread):
         try:
             loop.run_until_complete(self._stream())
         finally:
+            from guanlan.core.services.ai import AIClient
+
+            # 连接池绑定本事件循环，随循环一并关闭
+            loop.run_until_complete(AIClient.aclose_http())
             loop.run_until_complete(loop.shutdown_asyncgens())
             loop.close()
 
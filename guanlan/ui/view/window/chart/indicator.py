@@ -7,6 +7,7 @@
 Author: 海山观澜
 """
 
+import numpy as np
 import pandas as pd
 
 from guanlan.core.constants import COLOR_UP, COLOR_DOWN
@@ -203,7 +204,7 @@ class IndicatorManager:
                 # 取 display_offset 根用于显示，避免指标线只从当前位置开始
                 n = min(ind.display_offset, len(self._bars)) if ind.display_offset > 0 else len(self._bars)
                 init_bars = self._bars[-n:]
-                data = ind.on_init(init_bars)
+                data = ind.on_init_arrays(init_bars)
                 if not ind.overlay:
                     # 注意：调用方 (window.py _on_bar) 已包裹 bulk_run
                     self._create_subchart_lines(name, ind)
@@ -542,7 +543,7 @@ class IndicatorManager:
         # 取 display_offset 根用于显示，避免指标线只从当前位置开始
         n = min(ind.display_offset, len(self._bars)) if ind.display_offset > 0 else len(self._bars)
         init_bars = self._bars[-n:]
-        data = ind.on_init(init_bars)
+        data = ind.on_init_arrays(init_bars)
 
         if not ind.overlay:
             # 副图：用 bulk_run 将所有 JS 操作打包，防止异步渲染中间插入
@@ -575,11 +576,12 @@ class IndicatorManager:
 
     def _set_line_data(
         self, name: str, ind: BaseIndicator,
-        data: dict[str, list], bars: list[dict],
+        data: dict[str, np.ndarray], bars: list[dict],
     ) -> None:
-        """批量设置指标线数据"""
+        """批量设置指标线数据（按列构建 DataFrame，NaN 表示无值）"""
         lines = self._get_lines(name, ind)
         ld_map = {ld["name"]: ld for ld in ind.lines()}
+        times = [b["time"] for b in bars]
 
         for line_name, values in data.items():
             line = lines.get(line_name)
@@ -590,19 +592,25 @@ class IndicatorManager:
             color_up = ld.get("color_up")
             color_down = ld.get("color_down")
 
-            records = []
-            for i, v in enumerate(values):
-                if i >= len(bars):
-                    break
-                rec = {"time": bars[i]["time"]}
-                # 即使值为None也要添加列名，避免DataFrame缺少列导致错误
-                rec[line_name] = v
-                if v is not None and color_up and color_down:
-                    rec["color"] = color_up if v >= 0 else color_down
-                records.append(rec)
-
-            # 总是设置数据，即使为空，避免 series 未初始化导致 JS 错误
-            line.set(pd.DataFrame(records) if records else pd.DataFrame())
+            values = np.asarray(values, dtype=np.float64)
+            n = min(len(values), len(times))
+            if n == 0:
+                # 总是设置数据，即使为空，避免 series 未初始化导致 JS 错误
+                line.set(pd.DataFrame())
+                continue
+
+            # 即使值为 NaN 也要保留列，避免 DataFrame 缺少列导致错误
+            values = values[:n]
+            df = pd.DataFrame({"time": times[:n], line_name: values})
+
+            if color_up and color_down:
+                valid = ~np.isnan(values)
+                if valid.any():
+                    df["color"] = pd.Series(
+                        np.where(values >= 0, color_up, color_down)
+                    ).where(valid)
+
+            line.set(df)
 
     def _get_lines(self, name: str, ind: BaseIndicator) -> dict[str, object]:
         """获取指标对应的线字典"""
@@ -54,8 +54,7 @@ class SaveSchemeDialog(MessageBoxBase):
             )
             return False
 
-        schemes = chart_scheme.load_schemes()
-        if name in schemes:
+        if chart_scheme.has_scheme(name):
             InfoBar.warning(
                 "提示", f"方案 \"{name}\" 已存在，请换个名称",
                 parent=self, duration=2000, position=InfoBarPosition.TOP,
@@ -159,8 +158,7 @@ class _RenameDialog(MessageBoxBase):
             )
             return
         if name != self._old_name:
-            schemes = chart_scheme.load_schemes()
-            if name in schemes:
+            if chart_scheme.has_scheme(name):
                 InfoBar.warning(
                     "提示", f"方案 \"{name}\" 已存在",
                     parent=self, duration=2000, position=InfoBarPosition.TOP,
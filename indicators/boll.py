@@ -7,6 +7,8 @@
 Author: 海山观澜
 """
 
+from collections import deque
+
 import numpy as np
 from pydantic import Field
 
@@ -32,8 +34,8 @@ class TurtleIndicator(BaseIndicator):
 
     def __init__(self) -> None:
         super().__init__()
-        self._highs: list[float] = []
-        self._lows: list[float] = []
+        self._highs: deque[float] = deque()
+        self._lows: deque[float] = deque()
         self._prev_upper: float | None = None
         self._prev_lower: float | None = None
         self._prev_close: float | None = None
@@ -62,9 +64,12 @@ class TurtleIndicator(BaseIndicator):
 
     def _compute_init(self, bars: list[dict]) -> dict[str, np.ndarray]:
         """计算历史海龟通道数据"""
-        self._highs = [b["high"] for b in bars]
-        self._lows = [b["low"] for b in bars]
-        upper, lower = self._calc(np.array(self._highs), np.array(self._lows))
+        highs = np.array([b["high"] for b in bars])
+        lows = np.array([b["low"] for b in bars])
+        # 海龟通道只需 lookback 数据，但用 ×2 保险
+        self._highs = self._make_window(highs.tolist(), window_factor=2, min_size=100)
+        self._lows = self._make_window(lows.tolist(), window_factor=2, min_size=100)
+        upper, lower = self._calc(highs, lows)
         self.inited = True
 
         # 保存前一个有效值
@@ -81,11 +86,8 @@ class TurtleIndicator(BaseIndicator):
         self._highs.append(bar["high"])
         self._lows.append(bar["low"])
 
-        # 性能优化：只使用计算窗口，而不是全部历史
-        # 海龟通道只需 lookback 数据，但用 ×2 保险
-        highs_window = self._get_compute_window(self._highs, window_factor=2, min_size=100)
-        lows_window = self._get_compute_window(self._lows, window_factor=2, min_size=100)
-        upper, lower = self._calc(np.array(highs_window), np.array(lows_window))
+        # 性能优化：定长窗口只保留最近数据，而不是全部历史
+        upper, lower = self._calc(self._window_array(self._highs), self._window_array(self._lows))
 
         curr_upper = upper[-1]
         curr_lower = lower[-1]
@@ -11,7 +11,9 @@ import numpy as np
 from pydantic import Field
 from MyTT import MA
 
-from guanlan.core.indicators import BaseIndicator, BaseIndicatorParams, register_indicator
+from guanlan.core.indicators import (
+    BaseIndicator, BaseIndicatorParams, RunningMean, register_indicator,
+)
 
 
 class MACrossParams(BaseIndicatorParams):
@@ -29,7 +31,8 @@ class MACrossIndicator(BaseIndicator):
 
     def __init__(self) -> None:
         super().__init__()
-        self._closes: list[float] = []
+        self._short_ma: RunningMean | None = None
+        self._long_ma: RunningMean | None = None
         self._prev_short: float | None = None
         self._prev_long: float | None = None
         self._last_cross: str | None = None
@@ -46,16 +49,20 @@ class MACrossIndicator(BaseIndicator):
 
     def _compute_init(self, bars: list[dict]) -> dict[str, np.ndarray]:
         """计算历史双均线数据"""
-        self._closes = [b["close"] for b in bars]
-        short_ma = MA(np.array(self._closes), self.params.short_window)
-        long_ma = MA(np.array(self._closes), self.params.long_window)
+        closes = np.array([b["close"] for b in bars])
+        # 增量均线用最近的收盘价预热，后续逐根 O(1) 更新
+        recent = closes[-self.lookback:].tolist()
+        self._short_ma = RunningMean(self.params.short_window, recent)
+        self._long_ma = RunningMean(self.params.long_window, recent)
+        short_ma = MA(closes, self.params.short_window)
+        long_ma = MA(closes, self.params.long_window)
         short_name = f"MA{self.params.short_window}"
         long_name = f"MA{self.params.long_window}"
 
         self.inited = True
 
         # 保存最后两个值用于后续交叉检测
-        if len(self._closes) >= 2:
+        if len(closes) >= 2:
             self._prev_short = None if np.isnan(short_ma[-2]) else short_ma[-2]
             self._prev_long = None if np.isnan(long_ma[-2]) else long_ma[-2]
 
@@ -64,19 +71,18 @@ class MACrossIndicator(BaseIndicator):
 
     def _compute_bar(self, bar: dict) -> dict[str, float]:
         """计算单根 K 线的双均线值"""
-        self._closes.append(bar["close"])
-
-        # 性能优化：只使用计算窗口，而不是全部历史
-        # MA 是简单平均，只需 lookback 数据，但用 ×2 保险
-        window = self._get_compute_window(self._closes, window_factor=2, min_size=100)
-        short_ma = MA(np.array(window), self.params.short_window)
-        long_ma = MA(np.array(window), self.params.long_window)
+        # 未经 on_init_arrays 直接推送时从空数据开始
+        if self._short_ma is None:
+            self._short_ma = RunningMean(self.params.short_window)
+            self._long_ma = RunningMean(self.params.long_window)
+
+        # 性能优化：增量更新均线，不再每根重算整个窗口
+        close = bar["close"]
+        curr_short = self._short_ma.push(close)
+        curr_long = self._long_ma.push(close)
         short_name = f"MA{self.params.short_window}"
         long_name = f"MA{self.params.long_window}"
 
-        curr_short = short_ma[-1]
-        curr_long = long_ma[-1]
-
         # 检测交叉信号
         self._last_cross = None
         if (self._prev_short is not None and self._prev_long is not None
@@ -50,13 +50,13 @@ class MACDIndicator(BaseIndicator):
     def _compute_init(self, bars: list[dict]) -> dict[str, np.ndarray]:
         """计算历史 MACD 数据"""
         # 初始化实例变量
-        self._closes: list[float] = [b["close"] for b in bars]
+        closes = np.array([b["close"] for b in bars])
+        self._closes = self._make_window(closes.tolist(), window_factor=3, min_size=150)
         self._prev_dif: float | None = None
         self._prev_dea: float | None = None
         self._last_signal: dict | None = None
 
         # 计算并返回原始数据（包含 NaN）
-        closes = np.array(self._closes)
         dif, dea, macd = MACD(closes, self.params.short, self.params.long, self.params.signal)
         self.inited = True
 
@@ -76,9 +76,8 @@ class MACDIndicator(BaseIndicator):
         if len(self._closes) < self.lookback:
             return {"DIF": np.nan, "DEA": np.nan, "MACD": np.nan}
 
-        # 性能优化：只使用计算窗口，而不是全部历史
-        window = self._get_compute_window(self._closes, window_factor=3, min_size=150)
-        closes = np.array(window)
+        # 性能优化：定长窗口只保留最近数据，而不是全部历史
+        closes = self._window_array(self._closes)
         dif, dea, macd = MACD(closes, self.params.short, self.params.long, self.params.signal)
 
         curr_dif = dif[-1]
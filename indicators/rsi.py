@@ -45,13 +45,14 @@ class RSIIndicator(BaseIndicator):
     def _compute_init(self, bars: list[dict]) -> dict[str, np.ndarray]:
         """计算历史 RSI 数据"""
         # 初始化实例变量
-        self._closes: list[float] = [b["close"] for b in bars]
+        closes = np.array([b["close"] for b in bars])
+        self._closes = self._make_window(closes.tolist(), window_factor=3, min_size=100)
         self._prev_rsi: float | None = None
         self._last_signal: dict | None = None
 
         # 计算并返回原始数据（抑制除零警告）
         with np.errstate(invalid='ignore', divide='ignore'):
-            rsi = RSI(np.array(self._closes), self.params.period)
+            rsi = RSI(closes, self.params.period)
         self.inited = True
 
         # 保存最后一个有效值
@@ -71,10 +72,10 @@ class RSIIndicator(BaseIndicator):
         if len(self._closes) < self.lookback:
             return {"RSI": np.nan}
 
-        # 性能优化：只使用计算窗口，而不是全部历史
-        window = self._get_compute_window(self._closes, window_factor=3, min_size=100)
+        # 性能优化：定长窗口只保留最近数据，而不是全部历史
+        window = self._window_array(self._closes)
         with np.errstate(invalid='ignore', divide='ignore'):
-            rsi = RSI(np.array(window), self.params.period)
+            rsi = RSI(window, self.params.period)
         curr = rsi[-1]
 
         # 检测超买超卖穿越信号